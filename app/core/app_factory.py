@@ -5,20 +5,28 @@ from typing import Any
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, RedirectResponse
 
 from app.core.config import get_settings
 from app.core.lifespan import lifespan
 from app.core.logging import get_logger
 from app.presentation import api_router
 from app.presentation.exception_handlers import register_exception_handlers
-from app.presentation.middleware.error_handler import error_response_middleware
+from app.presentation.middleware.error_handler import ErrorResponseMiddleware
 from app.presentation.middleware.security_headers import SecurityHeadersMiddleware
-from app.presentation.middleware.session import session_middleware
+from app.presentation.middleware.session import SessionMiddleware
 
 logger = get_logger(__name__)
 
 
+_HEALTHCHECK_PATH = "/api/system/healthcheck"
+
+# GZip圧縮の対象とするレスポンスの最小サイズ（バイト）と圧縮レベル
+_GZIP_MINIMUM_SIZE = 1000
+_GZIP_COMPRESS_LEVEL = 5
+
+
 class HealthCheckFilter(logging.Filter):
     """ヘルスチェックログを除外するフィルター"""
 
@@ -26,13 +34,35 @@ class HealthCheckFilter(logging.Filter):
         """
         ログレコードをフィルタリング
 
+        uvicornのアクセスログはリクエストパスを3番目の引数として渡すため、
+        メッセージをフォーマットせずに引数を直接検査する。
+
         Args:
             record: ログレコード
 
         Returns:
             ログを出力する場合True、除外する場合False
         """
-        return "/api/system/healthcheck" not in record.getMessage()
+        args = record.args
+        if isinstance(args, tuple) and len(args) >= 3 and isinstance(args[2], str):
+            return _HEALTHCHECK_PATH not in args[2]
+        return _HEALTHCHECK_PATH not in record.getMessage()
+
+
+def _get_docs_paths(app: FastAPI) -> list[str]:
+    """
+    有効なAPIドキュメント関連のパスを取得
+
+    Args:
+        app: FastAPIアプリケーションインスタンス
+
+    Returns:
+        ドキュメント・OpenAPIスキーマのパスのリスト（無効化されたものは含まない）
+    """
+    paths = [app.docs_url, app.redoc_url, app.openapi_url]
+    if app.docs_url:
+        paths.append(app.swagger_ui_oauth2_redirect_url)
+    return [path for path in paths if path]
 
 
 def create_app() -> FastAPI:
@@ -50,6 +80,8 @@ def create_app() -> FastAPI:
         "description": "FastAPIアプリケーションのテンプレート",
         "version": "0.1.0",
         "lifespan": lifespan,
+        # エンドポイントのレスポンスは標準のjsonではなくorjsonでシリアライズする
+        "default_response_class": ORJSONResponse,
     }
 
     # 本番環境ではドキュメントを無効化
@@ -61,8 +93,17 @@ def create_app() -> FastAPI:
     # アプリ生成
     app = FastAPI(**app_params)
 
-    # ヘルスチェックログフィルター
-    logging.getLogger("uvicorn.access").addFilter(HealthCheckFilter())
+    # アクセスログ
+    access_logger = logging.getLogger("uvicorn.access")
+    if settings.access_log_enabled:
+        # ヘルスチェックログフィルター
+        access_logger.addFilter(HealthCheckFilter())
+    else:
+        # uvicornのaccess_log=False（--no-access-log）と同じ設定。
+        # ハンドラーがない場合、uvicornはリクエストごとのログレコードの生成自体を省略する
+        # （fastapi runにはアクセスログを無効化するオプションがないためここで設定する）
+        access_logger.handlers = []
+        access_logger.propagate = False
 
     # CORS
     if len(settings.BACKEND_CORS_ORIGINS) > 0:
@@ -80,9 +121,16 @@ def create_app() -> FastAPI:
     # 例外ハンドラー登録
     register_exception_handlers(app)
 
-    # ミドルウェア登録
-    app.middleware("http")(error_response_middleware)
-    app.middleware("http")(session_middleware)
+    # ミドルウェア登録（後に登録したものが外側で実行される）
+    app.add_middleware(ErrorResponseMiddleware)
+    app.add_middleware(SessionMiddleware, skip_paths=_get_docs_paths(app))
+    # レスポンス圧縮（エラーレスポンスも対象とするため最も外側に登録する）
+    # 小さなレスポンスは圧縮の効果よりもCPUコストが大きいため対象外とする
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=_GZIP_MINIMUM_SIZE,
+        compresslevel=_GZIP_COMPRESS_LEVEL,
+    )
 
     # ルーター登録
     app.include_router(api_router)
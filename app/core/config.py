@@ -106,6 +106,21 @@ class Settings(BaseSettings):
 
         return v
 
+    # セッション暗号化の形式・実装
+    # aesgcm: AES-256-GCM（生のバイト列）
+    # auto / rfernet / cryptography: Fernet（autoはrfernetが利用可能ならrfernet）
+    SESSION_ENCRYPTION_BACKEND: Literal["aesgcm", "auto", "rfernet", "cryptography"] = (
+        "aesgcm"
+    )
+
+    # プロセス内セッションキャッシュの有効期間（秒）。0の場合は無効
+    # 他のワーカープロセスでの更新・削除は最大でこの秒数だけ反映が遅れる
+    SESSION_CACHE_TTL: int = 0
+    SESSION_CACHE_MAX_SIZE: int = 10_000
+
+    # uvicornのアクセスログ。未設定の場合は本番環境のみ無効
+    ACCESS_LOG: bool | None = None
+
     SENTRY_DSN: str | None = None
     SENTRY_TRACES_SAMPLE_RATE: float = 1.0
 
@@ -123,6 +138,7 @@ class Settings(BaseSettings):
 
     BACKUP_SCHEDULE: str | None = None  # cron形式 (例: "0 3 * * *")
     BACKUP_RETENTION_DAYS: int = 7
+    BACKUP_COMPRESSION_LEVEL: int = 3  # zstd圧縮レベル (1-19、低いほど高速)
 
     S3_ENDPOINT: str | None = None
     S3_BUCKET: str | None = None
@@ -150,6 +166,13 @@ class Settings(BaseSettings):
         """テスト環境かどうか"""
         return self.ENV_MODE == "test"
 
+    @property
+    def access_log_enabled(self) -> bool:
+        """uvicornのアクセスログを出力するかどうか"""
+        if self.ACCESS_LOG is None:
+            return not self.is_production
+        return self.ACCESS_LOG
+
     @property
     def normalized_env_mode(self) -> str:
         if self.is_local:
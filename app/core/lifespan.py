@@ -1,17 +1,16 @@
 """アプリケーションライフサイクル管理"""
 
+import asyncio
 import contextlib
+import os
+import time
 from collections.abc import AsyncIterator
-from datetime import UTC, datetime
 from pathlib import Path
 
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
-from app.presentation.static.spa import SPAStaticFiles
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -31,14 +30,13 @@ def has_content(directory: Path) -> bool:
     Returns:
         .keep以外のファイル/フォルダが存在する場合True
     """
-    if not directory.exists():
+    # iterdir()のようにエントリごとにPathを生成せず、最初の該当エントリで打ち切る
+    try:
+        with os.scandir(directory) as entries:
+            return any(entry.name != ".keep" for entry in entries)
+    except FileNotFoundError:
         return False
 
-    for item in directory.iterdir():
-        if item.name != ".keep":
-            return True
-    return False
-
 
 @contextlib.asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
@@ -47,6 +45,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     起動時:
     - 起動時刻の記録
+    - ヘルスチェック用ロックの生成
     - データベースマイグレーション
     - バッチタスク登録
     - スケジューラー起動
@@ -63,8 +62,16 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     Yields:
         None
     """
-    # 起動時刻を記録（healthcheckのuptime計算用）
-    app.state.start_time = datetime.now(UTC)
+    # 起動時刻を記録（uptimeの計算にはシステム時刻の変更の影響を受けない単調時計を使用）
+    app.state.start_monotonic = time.monotonic()
+
+    # ヘルスチェックのDB接続チェック用ロック（このイベントループで生成する）
+    app.state.db_probe_lock = asyncio.Lock()
+
+    # フィンガープリント生成に使用するSHA-256の実装を確認
+    from app.infrastructure.security.encryption import log_hash_backend
+
+    log_hash_backend()
 
     # マイグレーション
     if settings.has_database:
@@ -88,8 +95,11 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     app.state.scheduler = scheduler
     start_scheduler(scheduler)
 
+    # 静的ファイル・テンプレート・SPAのモジュールは、有効な場合のみimportする
     # 静的ファイル
     if has_content(STATIC_DIR):
+        from fastapi.staticfiles import StaticFiles
+
         app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
         logger.info(f"Static files enabled: {STATIC_DIR}")
     else:
@@ -97,6 +107,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     # Jinja2テンプレート
     if has_content(TEMPLATES_DIR):
+        from fastapi.templating import Jinja2Templates
+
         app.state.templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
         logger.info(f"Jinja2 templates enabled: {TEMPLATES_DIR}")
     else:
@@ -109,6 +121,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         and FRONTEND_DIST_DIR.exists()
         and FRONTEND_DIST_DIR.is_dir()
     ):
+        from app.presentation.static.spa import SPAStaticFiles
+
         app.mount(
             "/admin",
             SPAStaticFiles(directory=str(FRONTEND_DIST_DIR), html=True),
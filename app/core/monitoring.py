@@ -2,9 +2,6 @@
 
 import os
 
-import newrelic.agent
-import sentry_sdk
-
 from app.core.config import get_settings
 from app.core.logging import get_logger
 
@@ -15,12 +12,15 @@ def init_monitoring() -> None:
     """
     Sentry/New Relicの初期化
 
-    本番環境でのみ有効化され、環境変数が設定されていない場合はスキップされる
+    本番環境でのみ有効化され、環境変数が設定されていない場合はスキップされる。
+    New Relicのエージェントは読み込みに時間がかかるため、有効な場合のみimportする
     """
     settings = get_settings()
 
     # New Relic
     if settings.is_production and settings.NEW_RELIC_LICENSE_KEY:
+        import newrelic.agent
+
         os.environ["NEW_RELIC_LICENSE_KEY"] = settings.NEW_RELIC_LICENSE_KEY
         os.environ["NEW_RELIC_APP_NAME"] = settings.NEW_RELIC_APP_NAME
 
@@ -44,6 +44,8 @@ def init_monitoring() -> None:
 
     # Sentry
     if settings.SENTRY_DSN:
+        import sentry_sdk
+
         sentry_sdk.init(
             dsn=settings.SENTRY_DSN,
             environment=settings.normalized_env_mode,
@@ -1,5 +1,7 @@
 """データベースバックアップタスク"""
 
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -8,7 +10,18 @@ import opendal
 from app.core.config import get_settings
 from app.infrastructure.batch.base import BatchTask
 from app.infrastructure.batch.registry import task_registry
-from app.infrastructure.database.backup.core import create_backup
+from app.infrastructure.database.backup.core import (
+    create_backup,
+    is_backup_file,
+    parse_backup_timestamp,
+)
+
+# S3へのアップロード時に1回で書き込むサイズ（8 MiB）
+# （S3のマルチパートアップロードでは最後以外のパートが5 MiB以上である必要がある）
+_UPLOAD_CHUNK_SIZE = 8 << 20
+
+# S3上の古いバックアップを並列に削除するワーカー数の上限
+_MAX_DELETE_WORKERS = 8
 
 
 class BackupTask(BatchTask):
@@ -80,6 +93,8 @@ class BackupTask(BatchTask):
         """
         ダンプファイルをS3にアップロードする。
 
+        ファイル全体をメモリに読み込まず、チャンク単位でストリーミングする。
+
         Args:
             file_path: アップロードするファイルパス
             remote_name: S3上のファイル名
@@ -91,8 +106,11 @@ class BackupTask(BatchTask):
             return
 
         try:
-            with open(file_path, "rb") as f:
-                self.storage.write(remote_name, f.read())
+            with (
+                file_path.open("rb") as src,
+                self.storage.open(remote_name, "wb") as dst,
+            ):
+                shutil.copyfileobj(src, dst, _UPLOAD_CHUNK_SIZE)
             self.logger.info(f"Uploaded to S3: {remote_name}")
         except Exception as e:
             self.logger.error(f"Failed to upload to S3: {e}")
@@ -110,14 +128,13 @@ class BackupTask(BatchTask):
         # ローカルファイルのクリーンアップ
         local_backup_dir = Path("./backups")
         if local_backup_dir.exists():
-            for backup_file in local_backup_dir.glob("backup_*.backup.gz"):
+            for backup_file in local_backup_dir.glob("backup_*"):
+                if not is_backup_file(backup_file.name):
+                    continue
+
                 # ファイル名から日時を抽出
                 try:
-                    # backup_20250101_120000.backup.gz -> 20250101_120000
-                    timestamp_str = backup_file.stem.replace(".backup", "").replace(
-                        "backup_", ""
-                    )
-                    file_date = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
+                    file_date = parse_backup_timestamp(backup_file.name)
 
                     if file_date < cutoff_date:
                         backup_file.unlink()
@@ -130,31 +147,52 @@ class BackupTask(BatchTask):
         # S3ファイルのクリーンアップ
         if self.storage:
             try:
-                # S3上のバックアップファイルをリスト
-                entries = self.storage.list("")
-                for entry in entries:
-                    if not entry.path.startswith("backup_"):
-                        continue
-                    if not entry.path.endswith(".backup.gz"):
+                # S3上のバックアップファイルをリストし、削除対象を集める
+                old_backups: list[str] = []
+                for entry in self.storage.list(""):
+                    if not is_backup_file(entry.path):
                         continue
 
                     # ファイル名からタイムスタンプを抽出
                     try:
-                        # backup_20250101_120000.backup.gz -> 20250101_120000
-                        timestamp_str = entry.path.replace("backup_", "").replace(
-                            ".backup.gz", ""
-                        )
-                        file_date = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
-
-                        if file_date < cutoff_date:
-                            self.storage.delete(entry.path)
-                            self.logger.info(f"Deleted old S3 backup: {entry.path}")
-                    except (ValueError, Exception) as e:
+                        if parse_backup_timestamp(entry.path) < cutoff_date:
+                            old_backups.append(entry.path)
+                    except ValueError as e:
                         self.logger.warning(
                             f"Failed to process S3 file {entry.path}: {e}"
                         )
             except Exception as e:
                 self.logger.error(f"Failed to cleanup S3 backups: {e}")
+                return
+
+            self._delete_s3_backups(old_backups)
+
+    def _delete_s3_backups(self, paths: list[str]) -> None:
+        """
+        S3上のバックアップファイルを並列に削除する。
+
+        OpenDALには複数オブジェクトを一括で削除するAPIがないため、
+        削除リクエストをスレッドプールで並列に発行して往復の待ち時間を重ねる。
+
+        Args:
+            paths: 削除するS3上のファイル名のリスト
+        """
+        if not self.storage or not paths:
+            return
+
+        storage = self.storage
+
+        def delete(path: str) -> None:
+            try:
+                storage.delete(path)
+                self.logger.info(f"Deleted old S3 backup: {path}")
+            except Exception as e:
+                self.logger.warning(f"Failed to delete S3 file {path}: {e}")
+
+        workers = min(_MAX_DELETE_WORKERS, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # 例外はdelete内で処理するため、結果は参照しない
+            list(executor.map(delete, paths))
 
 
 def run_backup() -> None:
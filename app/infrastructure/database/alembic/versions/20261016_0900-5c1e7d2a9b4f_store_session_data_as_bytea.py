@@ -0,0 +1,41 @@
+"""store_session_data_as_bytea
+
+Revision ID: 5c1e7d2a9b4f
+Revises: 0aa2828fc065
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5c1e7d2a9b4f"
+down_revision = "0aa2828fc065"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 既存のFernetトークン（ASCII文字列）はそのままバイト列として保持する
+    op.alter_column(
+        "sessions",
+        "data",
+        existing_type=sa.Text(),
+        type_=sa.LargeBinary(),
+        existing_nullable=False,
+        postgresql_using="convert_to(data, 'UTF8')",
+    )
+
+
+def downgrade() -> None:
+    # AES-GCM形式のデータは文字列に変換できないため、セッションを破棄する
+    op.execute("DELETE FROM sessions")
+    op.alter_column(
+        "sessions",
+        "data",
+        existing_type=sa.LargeBinary(),
+        type_=sa.Text(),
+        existing_nullable=False,
+        postgresql_using="convert_from(data, 'UTF8')",
+    )
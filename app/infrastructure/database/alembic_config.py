@@ -0,0 +1,35 @@
+"""
+Alembic設定の生成
+
+マイグレーション実行とバックアップ処理で共通のAlembic設定を提供します。
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+from alembic.config import Config
+
+# スクリプトディレクトリの絶対パス（モジュール読み込み時に一度だけ解決）
+_SCRIPT_LOCATION = str((Path(__file__).parent / "alembic").resolve())
+
+
+@lru_cache(maxsize=1)
+def get_alembic_config(database_uri: str) -> Config:
+    """
+    Alembic設定オブジェクトを取得する（データベースURLごとにキャッシュ）
+
+    Args:
+        database_uri: データベース接続URL
+
+    Returns:
+        Config: Alembic設定オブジェクト
+    """
+    alembic_cfg = Config()
+
+    # スクリプトディレクトリの絶対パスを設定
+    alembic_cfg.set_main_option("script_location", _SCRIPT_LOCATION)
+
+    # データベースURLを設定
+    alembic_cfg.set_main_option("sqlalchemy.url", database_uri)
+
+    return alembic_cfg
@@ -1,23 +1,40 @@
 """データベースバックアップ・リストアのコアロジック"""
 
+import binascii
 import gzip
+import os
+import shutil
+import tempfile
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-
-from alembic.config import Config
+from typing import IO, Any, BinaryIO, cast
+
+import orjson
+import zstandard
+from psycopg2 import sql
+from psycopg2.extensions import connection as psycopg2_connection
+from psycopg2.extras import Json, execute_values
+from pydantic_core import to_jsonable_python
 from sqlalchemy import (
+    JSON,
+    Connection,
+    Engine,
+    LargeBinary,
     MetaData,
     Table,
     create_engine,
     delete,
+    exists,
     func,
     inspect,
     select,
     text,
 )
 
-from app.core.config import Settings, get_settings
+from app.core.config import get_settings
 from app.core.logging import get_logger
 
 from .models import (
@@ -25,33 +42,197 @@ from .models import (
     BackupMetadata,
     DiffSummary,
     RestoreResult,
-    TableBackup,
     TableDiff,
 )
 
 logger = get_logger(__name__)
 
+# リストア時に1文のINSERTにまとめる行数
+_INSERT_PAGE_SIZE = 1000
+
+# バックアップ時にサーバーサイドカーソルから1回に取得する行数
+_FETCH_BATCH_SIZE = 10_000
+
+# バックアップ時にテーブルを並列に読み出すワーカー数の上限
+_MAX_DUMP_WORKERS = 4
+
+# 並列バックアップ時にテーブルごとの一時データをメモリ上に保持する上限（8 MiB）
+_SPOOL_MAX_SIZE = 8 << 20
+
+# バックアップファイル読み書き時のバッファサイズ（1 MiB）
+_IO_BUFFER_SIZE = 1 << 20
+
+# バックアップファイルの拡張子（zstd圧縮）
+BACKUP_FILE_SUFFIX = ".backup.zst"
+
+# 読み込み可能なバックアップファイルの拡張子（旧形式のgzipを含む）
+BACKUP_FILE_SUFFIXES = (BACKUP_FILE_SUFFIX, ".backup.gz")
+
+# バイナリ値をbase64文字列として保存する際の接頭辞
+# （PostgreSQLのテキスト型はNUL文字を格納できないため通常の文字列と衝突しない）
+_BYTES_PREFIX = "\x00b64:"
 
-def _create_alembic_config(settings: Settings) -> Config:
+# 圧縮形式判定用のマジックバイト
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# リフレクション済みメタデータのキャッシュ（キー: データベースURL）
+_reflected_metadata: dict[str, MetaData] = {}
+
+
+def _get_table(conn: Connection, table_name: str) -> Table:
     """
-    Alembic設定オブジェクトを作成する
+    リフレクション済みのTableオブジェクトを取得する
+
+    初回呼び出し時にスキーマ全体を一括でリフレクションし、以降は
+    キャッシュから返す。キャッシュに存在しないテーブルが要求された場合は
+    スキーマを再リフレクションする。
+
+    カラム定義の変更は検知しないため、テーブル名のみを使う読み取り処理
+    （diff計算時の行数カウント）に限って使用する。
 
     Args:
-        settings: アプリケーション設定
+        conn: データベース接続
+        table_name: テーブル名
 
     Returns:
-        Config: Alembic設定オブジェクト
+        Table: リフレクションされたTableオブジェクト
     """
-    alembic_cfg = Config()
+    cache_key = str(conn.engine.url)
+    metadata = _reflected_metadata.get(cache_key)
+    if metadata is None or table_name not in metadata.tables:
+        metadata = MetaData()
+        metadata.reflect(bind=conn)
+        _reflected_metadata[cache_key] = metadata
+    return metadata.tables[table_name]
 
-    # スクリプトディレクトリの絶対パスを設定
-    script_location = (Path(__file__).parent.parent / "alembic").resolve()
-    alembic_cfg.set_main_option("script_location", str(script_location))
 
-    # データベースURLを設定
-    alembic_cfg.set_main_option("sqlalchemy.url", settings.database_uri)
+def _reflect_tables(conn: Connection, table_names: list[str]) -> MetaData:
+    """
+    指定テーブルのスキーマを一括でリフレクションし、キャッシュを更新する
 
-    return alembic_cfg
+    テーブルごとにカラム情報を問い合わせる代わりに1回のリフレクションで
+    全テーブルの定義を取得する。常に最新のスキーマを読み直すため、
+    長時間稼働するプロセスでもマイグレーション後のカラム変更を取りこぼさない。
+    カラム定義を使う処理（バックアップ・リストア）ではこちらを使用する。
+
+    Args:
+        conn: データベース接続
+        table_names: 対象テーブル名のリスト
+
+    Returns:
+        MetaData: リフレクション済みのメタデータ
+    """
+    metadata = MetaData()
+    metadata.reflect(bind=conn, only=table_names)
+    _reflected_metadata[str(conn.engine.url)] = metadata
+    return metadata
+
+
+def is_backup_file(filename: str) -> bool:
+    """
+    ファイル名がバックアップファイルの命名規則に一致するか判定する
+
+    Args:
+        filename: ファイル名
+
+    Returns:
+        bool: バックアップファイル（zstd形式または旧gzip形式）の場合True
+    """
+    return filename.startswith("backup_") and filename.endswith(BACKUP_FILE_SUFFIXES)
+
+
+def parse_backup_timestamp(filename: str) -> datetime:
+    """
+    バックアップファイル名から作成日時を取り出す
+
+    Args:
+        filename: バックアップファイル名（例: backup_20250101_120000.backup.zst）
+
+    Returns:
+        datetime: ファイル名に含まれる作成日時
+
+    Raises:
+        ValueError: ファイル名が命名規則に一致しない場合
+    """
+    for suffix in BACKUP_FILE_SUFFIXES:
+        if filename.endswith(suffix):
+            # backup_20250101_120000.backup.zst -> 20250101_120000
+            timestamp_str = filename.removeprefix("backup_").removesuffix(suffix)
+            return datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
+    raise ValueError(f"Not a backup file: {filename}")
+
+
+def _read_backup_data(backup_path: Path) -> BackupData:
+    """
+    バックアップファイルを読み込んで解凍・パースする
+
+    先頭のマジックバイトで圧縮形式を判定するため、zstd形式に加えて
+    旧形式（gzip）のバックアップファイルも読み込める。
+
+    Args:
+        backup_path: バックアップファイルのパス
+
+    Returns:
+        BackupData: バックアップデータ
+
+    Raises:
+        FileNotFoundError: バックアップファイルが存在しない場合
+        ValueError: 未対応の圧縮形式の場合
+    """
+    if not backup_path.exists():
+        raise FileNotFoundError(f"Backup file not found: {backup_path}")
+
+    # 圧縮データ全体をメモリに読み込まず、ファイルから直接ストリーム解凍する
+    with backup_path.open("rb", buffering=_IO_BUFFER_SIZE) as f:
+        magic = f.read(len(_ZSTD_MAGIC))
+        f.seek(0)
+        if magic.startswith(_ZSTD_MAGIC):
+            with zstandard.ZstdDecompressor().stream_reader(f, closefd=False) as zf:
+                json_bytes = zf.read()
+        elif magic.startswith(_GZIP_MAGIC):
+            with gzip.GzipFile(fileobj=f, mode="rb") as gz:
+                json_bytes = gz.read()
+        else:
+            raise ValueError(f"Unsupported backup file format: {backup_path.name}")
+
+    return BackupData.model_validate_json(json_bytes)
+
+
+@lru_cache
+def _get_engine(database_uri: str) -> Engine:
+    """
+    バックアップ・リストア用のEngineを取得する（URLごとにキャッシュ）
+
+    呼び出しごとのEngine生成（URL解析・コネクションプール構築）を避ける。
+    接続先はテスト等で設定が切り替わることがあるため、URLをキーにキャッシュする。
+
+    Args:
+        database_uri: データベース接続URL
+
+    Returns:
+        Engine: SQLAlchemy Engine
+    """
+    return create_engine(database_uri)
+
+
+def _read_migration_version(conn: Connection) -> str:
+    """
+    接続からalembic_versionテーブルのリビジョンを読み取る
+
+    Args:
+        conn: データベース接続
+
+    Returns:
+        str: 現在のAlembicリビジョンID（マイグレーション未適用の場合は空文字列）
+    """
+    result = conn.execute(text("SELECT version_num FROM alembic_version")).fetchone()
+
+    if result:
+        return str(result[0])
+    else:
+        logger.warning("No migration version found in database")
+        return ""
 
 
 def get_current_migration_version() -> str:
@@ -68,156 +249,447 @@ def get_current_migration_version() -> str:
         settings = get_settings()
 
         # データベースから現在のリビジョンを取得
-        from sqlalchemy import create_engine, text
-
-        engine = create_engine(settings.database_uri)
+        engine = _get_engine(settings.database_uri)
         with engine.connect() as conn:
-            # alembic_versionテーブルから現在のバージョンを取得
-            result = conn.execute(
-                text("SELECT version_num FROM alembic_version")
-            ).fetchone()
-
-            if result:
-                return str(result[0])
-            else:
-                logger.warning("No migration version found in database")
-                return ""
+            return _read_migration_version(conn)
 
     except Exception as e:
         logger.error(f"Failed to get migration version: {e}")
         raise RuntimeError(f"Failed to get migration version: {e}") from e
 
 
-def _serialize_value(value: Any) -> Any:
+def _serialize_bytes(value: bytes | bytearray | memoryview | None) -> str | None:
     """
-    データベースの値をJSON化可能な形式に変換する
+    バイナリ値をJSON化可能な形式に変換する
+
+    値ごとに辞書を生成せず、_BYTES_PREFIXを付けたbase64文字列として表現する。
 
     Args:
-        value: データベースの値
+        value: バイナリカラムの値
 
     Returns:
-        JSON化可能な値
+        _BYTES_PREFIX付きのbase64文字列（Noneの場合はNone）
     """
     if value is None:
         return None
-    if isinstance(value, datetime):
-        return value.isoformat()
-    if isinstance(value, (bytes, bytearray)):
-        # バイナリデータはbase64エンコード
-        import base64
-
-        return {"__type__": "bytes", "data": base64.b64encode(value).decode("utf-8")}
-    # その他はそのまま返す（int, str, float, bool等）
-    return value
+    # base64モジュールのラッパーを経由せずCのbinasciiを直接呼ぶ
+    return _BYTES_PREFIX + binascii.b2a_base64(value, newline=False).decode("ascii")
 
 
-def create_backup(output_dir: Path | None = None) -> Path:
+def _build_row_serializer(
+    table_obj: Table, columns: list[str]
+) -> Callable[[Sequence[Any]], Sequence[Any]] | None:
     """
-    データベースのバックアップを作成する
+    テーブルの行をJSON化可能な形式に変換する関数を作成する
+
+    変換が必要なカラムの判定をテーブルごとに1回だけ行い、セルごとの
+    型判定を省く。変換が必要なのはバイナリカラムのみで、datetime等は
+    orjsonが直接シリアライズする。
 
     Args:
-        output_dir: 出力先ディレクトリ（Noneの場合は ./backups）
+        table_obj: リフレクション済みのTableオブジェクト
+        columns: カラム名のリスト（行の値と同じ順序）
 
     Returns:
-        Path: 作成されたバックアップファイルのパス
+        行を受け取り、JSON化可能な値のシーケンスを返す関数
+        （変換が不要な場合はNone）
+    """
+    binary_indexes = [
+        i
+        for i, name in enumerate(columns)
+        if isinstance(table_obj.c[name].type, LargeBinary)
+    ]
+
+    # バイナリカラムがなければ値をそのまま使う
+    if not binary_indexes:
+        return None
 
-    Raises:
-        RuntimeError: バックアップの作成に失敗した場合
+    def serialize(row: Sequence[Any]) -> Sequence[Any]:
+        values = list(row)
+        for i in binary_indexes:
+            values[i] = _serialize_bytes(values[i])
+        return values
+
+    return serialize
+
+
+def _iter_row_batches(
+    conn: Connection, table_obj: Table, columns: list[str]
+) -> Iterator[list[tuple[Any, ...]]]:
+    """
+    テーブルの全行を_FETCH_BATCH_SIZE行ずつ取得する
+
+    psycopg2使用時はDBAPIの名前付き（サーバーサイド）カーソルから直接
+    タプルを取得し、SQLAlchemyのRowオブジェクト生成を省く。
+    それ以外のドライバではSQLAlchemyのストリーミング実行を使用する。
+
+    Args:
+        conn: データベース接続
+        table_obj: 取得対象のTableオブジェクト
+        columns: 取得するカラム名のリスト（返す行の値と同じ順序）
+
+    Yields:
+        行（値のタプル）のリスト
     """
+    if conn.dialect.driver != "psycopg2":
+        result = conn.execution_options(
+            stream_results=True, yield_per=_FETCH_BATCH_SIZE
+        ).execute(select(*(table_obj.c[name] for name in columns)))
+        for partition in result.partitions():
+            yield [tuple(row) for row in partition]
+        return
+
+    stmt = sql.SQL("SELECT {} FROM {}").format(
+        sql.SQL(", ").join(sql.Identifier(name) for name in columns),
+        sql.Identifier(table_obj.name),
+    )
+    dbapi_conn = cast(psycopg2_connection, conn.connection.dbapi_connection)
+    cursor = dbapi_conn.cursor(name="backup_cursor")
     try:
-        settings = get_settings()
+        cursor.itersize = _FETCH_BATCH_SIZE
+        cursor.execute(stmt)
+        while batch := cursor.fetchmany(_FETCH_BATCH_SIZE):
+            yield batch
+    finally:
+        cursor.close()
 
-        # 出力先ディレクトリの確保
-        if output_dir is None:
-            output_dir = Path("./backups")
-        output_dir.mkdir(parents=True, exist_ok=True)
 
-        # マイグレーションバージョンを取得
-        migration_version = get_current_migration_version()
+class _CountingWriter:
+    """
+    書き込んだバイト数を数えながら下位のストリームへ転送するライター
+
+    圧縮前のJSONサイズをログ出力するために使用する。
+    """
+
+    def __init__(self, stream: BinaryIO) -> None:
+        self._stream = stream
+        self.bytes_written = 0
+
+    def write(self, data: bytes) -> None:
+        """
+        データを書き込む
+
+        Args:
+            data: 書き込むデータ
+        """
+        self._stream.write(data)
+        self.bytes_written += len(data)
+
 
-        # メタデータ作成
-        metadata = BackupMetadata(
-            timestamp=datetime.now(UTC),
-            migration_version=migration_version,
-            database_name=settings.POSTGRES_DB,
-            database_host=settings.POSTGRES_HOST,
+def _write_table_json(
+    write: Callable[[bytes], object], conn: Connection, table_obj: Table
+) -> int:
+    """
+    テーブルの全行をTableBackupと同じ構造のJSONとして書き出す
+
+    row_countは全行の読み出し後に確定するため末尾に置く。
+
+    Args:
+        write: 書き出し先の関数
+        conn: データベース接続
+        table_obj: リフレクション済みのTableオブジェクト
+
+    Returns:
+        int: 書き出した行数
+    """
+    columns = [col.name for col in table_obj.columns]
+    write(b'{"columns":')
+    write(orjson.dumps(columns))
+    write(b',"data":[')
+
+    # サーバーサイドカーソルで_FETCH_BATCH_SIZE行ずつ取得して書き出す
+    row_count = 0
+    serialize_row = _build_row_serializer(table_obj, columns)
+    for batch in _iter_row_batches(conn, table_obj, columns):
+        serialized_rows: Sequence[Sequence[Any]] = (
+            batch if serialize_row is None else [serialize_row(row) for row in batch]
         )
+        if row_count > 0:
+            write(b",")
+        # 外側の[]を除いて行を連結する
+        write(orjson.dumps(serialized_rows, default=to_jsonable_python)[1:-1])
+        row_count += len(batch)
 
-        logger.info("Creating database backup...")
-        logger.info(f"Migration version: {migration_version}")
+    write(b'],"row_count":')
+    write(orjson.dumps(row_count))
+    write(b"}")
+    return row_count
 
-        # データベースに接続
-        engine = create_engine(settings.database_uri)
-        inspector = inspect(engine)
 
-        # 全テーブルのデータを取得
-        tables_data: dict[str, TableBackup] = {}
-        total_rows = 0
-        total_size_bytes = 0
+def _dump_table_to_spool(
+    engine: Engine, snapshot_id: str, table_obj: Table
+) -> tuple[IO[bytes], int]:
+    """
+    エクスポートされたスナップショット上でテーブルを一時ファイルへ書き出す
 
-        table_names = inspector.get_table_names()
+    並列バックアップのワーカースレッドで実行する。一時ファイルは
+    _SPOOL_MAX_SIZEまではメモリ上に保持し、超過分はディスクへ書き出す。
 
-        for table_name in table_names:
-            # alembic_versionテーブルはスキップ（メタデータに含まれているため）
-            if table_name == "alembic_version":
+    Args:
+        engine: 使用するEngine
+        snapshot_id: pg_export_snapshot()で取得したスナップショットID
+        table_obj: リフレクション済みのTableオブジェクト
+
+    Returns:
+        tuple[IO[bytes], int]: 先頭にシーク済みの一時ファイルと行数
+    """
+    # 呼び出し元へ返すためwithで閉じない
+    spool = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)  # noqa: SIM115
+    try:
+        with engine.connect().execution_options(
+            isolation_level="REPEATABLE READ"
+        ) as conn:
+            # メイン接続と同一時点のデータを読む（トランザクションの最初の文である必要がある）
+            conn.exec_driver_sql("SET TRANSACTION SNAPSHOT %s", (snapshot_id,))
+            row_count = _write_table_json(spool.write, conn, table_obj)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool, row_count
+
+
+def _find_empty_tables(
+    conn: Connection, tables: list[Table], row_estimates: dict[str, int]
+) -> set[str]:
+    """
+    空のテーブルを検出する
+
+    統計情報の推定行数が0（または未収集）のテーブルのみを対象に、
+    1行だけ存在確認を行う。推定値は古い可能性があるため、推定値だけでは
+    空と判定しない。
+
+    Args:
+        conn: データベース接続
+        tables: 対象テーブルのリスト
+        row_estimates: テーブル名をキー、推定行数を値とする辞書
+
+    Returns:
+        set[str]: 空のテーブル名の集合
+    """
+    return {
+        table_obj.name
+        for table_obj in tables
+        if row_estimates.get(table_obj.name, 0) == 0
+        and not conn.execute(select(exists().select_from(table_obj))).scalar()
+    }
+
+
+def _write_tables(
+    writer: _CountingWriter,
+    conn: Connection,
+    tables: list[Table],
+    empty_tables: set[str],
+    snapshot_id: str | None,
+    workers: int,
+) -> int:
+    """
+    全テーブルのデータを {"テーブル名": {...}, ...} の形式で書き出す
+
+    snapshot_idが指定された場合は、各テーブルを別スレッド・別接続で
+    並列に読み出し、テーブルの順序どおりに書き出す。空のテーブルは
+    データを読み出さず、カラム名のみを書き出す。
+
+    Args:
+        writer: 書き出し先
+        conn: データベース接続（逐次処理時に使用）
+        tables: 対象テーブルのリスト
+        empty_tables: 空であることが確認済みのテーブル名の集合
+        snapshot_id: 並列処理時に共有するスナップショットID（Noneの場合は逐次処理）
+        workers: 並列処理時のワーカー数
+
+    Returns:
+        int: 書き出した総行数
+    """
+    total_rows = 0
+    executor = ThreadPoolExecutor(max_workers=workers) if snapshot_id else None
+    futures: dict[str, Future[tuple[IO[bytes], int]]] = {}
+    # 書き出し待ちの一時ファイルがデータベース全体の大きさまで溜まらないよう、
+    # 投入済みで未書き出しのテーブルをworkers件までに制限し、
+    # 1テーブル書き出すごとに次のテーブルを投入する
+    pending_tables = iter([
+        table_obj for table_obj in tables if table_obj.name not in empty_tables
+    ])
+
+    def submit_next() -> None:
+        if executor is None or snapshot_id is None:
+            return
+        table_obj = next(pending_tables, None)
+        if table_obj is not None:
+            futures[table_obj.name] = executor.submit(
+                _dump_table_to_spool, conn.engine, snapshot_id, table_obj
+            )
+
+    try:
+        for _ in range(workers if executor else 0):
+            submit_next()
+
+        for index, table_obj in enumerate(tables):
+            size_before = writer.bytes_written
+            if index > 0:
+                writer.write(b",")
+            writer.write(orjson.dumps(table_obj.name))
+            writer.write(b":")
+
+            if table_obj.name in empty_tables:
+                writer.write(b'{"columns":')
+                writer.write(orjson.dumps([col.name for col in table_obj.columns]))
+                writer.write(b',"data":[],"row_count":0}')
                 continue
 
-            with engine.connect() as conn:
-                # カラム情報を取得
-                columns = [col["name"] for col in inspector.get_columns(table_name)]
+            if executor:
+                spool, row_count = futures.pop(table_obj.name).result()
+                with spool:
+                    shutil.copyfileobj(spool, writer, _IO_BUFFER_SIZE)
+                submit_next()
+            else:
+                row_count = _write_table_json(writer.write, conn, table_obj)
 
-                # 動的にTableオブジェクトを作成（安全なクエリ構築のため）
-                table_meta = MetaData()
-                table_obj = Table(table_name, table_meta, autoload_with=engine)
+            # 統計情報をログ出力
+            table_size_kb = (writer.bytes_written - size_before) / 1024
+            logger.info(
+                f"- {table_obj.name}: {row_count} rows ({table_size_kb:.2f} KB)"
+            )
 
-                # 全行を取得
-                stmt = select(table_obj)
-                result = conn.execute(stmt)
-                rows = result.fetchall()
+            total_rows += row_count
+    finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
+            # 途中で失敗した場合、完了済みで未書き出しの一時ファイルを閉じる
+            for future in futures.values():
+                if not future.cancelled() and future.exception() is None:
+                    future.result()[0].close()
 
-                # データをシリアライズ
-                serialized_rows = [
-                    [_serialize_value(val) for val in row] for row in rows
-                ]
+    if empty_tables:
+        logger.info(f"- {len(empty_tables)} empty tables (skipped)")
 
-                # テーブルデータを格納
-                table_backup = TableBackup(
-                    row_count=len(rows), columns=columns, data=serialized_rows
-                )
-                tables_data[table_name] = table_backup
+    return total_rows
 
-                # 統計情報をログ出力
-                table_json = table_backup.model_dump_json()
-                table_size_kb = len(table_json.encode("utf-8")) / 1024
-                logger.info(
-                    f"- {table_name}: {len(rows)} rows ({table_size_kb:.2f} KB)"
-                )
 
-                total_rows += len(rows)
-                total_size_bytes += len(table_json.encode("utf-8"))
+def create_backup(
+    output_dir: Path | None = None,
+    engine: Engine | None = None,
+    max_workers: int | None = None,
+) -> Path:
+    """
+    データベースのバックアップを作成する
+
+    バックアップ全体を1つのJSON文字列として組み立てず、サーバーサイド
+    カーソルから取得した行をバッチ単位でシリアライズし、圧縮ストリームへ
+    逐次書き出す。PostgreSQL（psycopg2）ではpg_dump -jと同様に
+    スナップショットをエクスポートし、複数テーブルを並列に読み出す。
+
+    Args:
+        output_dir: 出力先ディレクトリ（Noneの場合は ./backups）
+        engine: 使用するEngine（Noneの場合は設定のデータベースURLから取得）
+        max_workers: テーブルを並列に読み出すワーカー数の上限
+            （Noneの場合はmin(4, CPU数)、1の場合は逐次処理）
+
+    Returns:
+        Path: 作成されたバックアップファイルのパス
 
-        # バックアップデータを作成
-        backup_data = BackupData(metadata=metadata, tables=tables_data)
+    Raises:
+        RuntimeError: バックアップの作成に失敗した場合
+    """
+    output_path: Path | None = None
 
-        # JSON化
-        json_data = backup_data.model_dump_json(indent=2)
-        json_size_kb = len(json_data.encode("utf-8")) / 1024
+    try:
+        settings = get_settings()
 
-        # gzip圧縮
-        compressed_data = gzip.compress(json_data.encode("utf-8"))
-        compressed_size_kb = len(compressed_data) / 1024
+        # 出力先ディレクトリの確保
+        if output_dir is None:
+            output_dir = Path("./backups")
+        output_dir.mkdir(parents=True, exist_ok=True)
 
-        # ファイル名生成
-        timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"backup_{timestamp_str}.backup.gz"
-        output_path = output_dir / filename
+        if engine is None:
+            engine = _get_engine(settings.database_uri)
 
-        # ファイル保存
-        output_path.write_bytes(compressed_data)
+        if max_workers is None:
+            max_workers = min(_MAX_DUMP_WORKERS, os.cpu_count() or 1)
 
-        logger.info(
-            f"Total: {len(table_names) - 1} tables, {total_rows} rows"
-        )  # -1 for alembic_version
+        with engine.connect() as conn:
+            # 単一のトランザクション内で全テーブルを同一時点のスナップショットから読む
+            # （スナップショットのエクスポートにもREPEATABLE READ以上が必要）
+            if conn.dialect.name == "postgresql":
+                conn = conn.execution_options(isolation_level="REPEATABLE READ")
+            parallel = max_workers > 1 and conn.dialect.driver == "psycopg2"
+
+            # マイグレーションバージョンを取得
+            migration_version = _read_migration_version(conn)
+
+            # メタデータ作成
+            metadata = BackupMetadata(
+                timestamp=datetime.now(UTC),
+                migration_version=migration_version,
+                database_name=settings.POSTGRES_DB,
+                database_host=settings.POSTGRES_HOST,
+            )
+
+            logger.info("Creating database backup...")
+            logger.info(f"Migration version: {migration_version}")
+
+            inspector = inspect(conn)
+
+            # alembic_versionテーブルはスキップ（メタデータに含まれているため）
+            table_names = [
+                name
+                for name in inspector.get_table_names()
+                if name != "alembic_version"
+            ]
+
+            # 全テーブルの定義を一括取得（安全なクエリ構築のため）
+            reflected = _reflect_tables(conn, table_names)
+            tables = [reflected.tables[name] for name in table_names]
+
+            # 読み出し前の目安として統計情報の推定行数をログ出力
+            # （バックアップに記録するrow_countは書き出し時に数えた正確な値）
+            empty_tables: set[str] = set()
+            if conn.dialect.name == "postgresql":
+                row_estimates = _fast_row_counts(conn, table_names)
+                logger.info(
+                    f"Backing up {len(table_names)} tables "
+                    f"(~{sum(row_estimates.values())} rows estimated)"
+                )
+                # 空のテーブルはサーバーサイドカーソルを開かずに書き出す
+                empty_tables = _find_empty_tables(conn, tables, row_estimates)
+
+            # 並列処理用にスナップショットをエクスポート
+            # （この接続のトランザクションが続く間、ワーカーから取り込める）
+            workers = min(max_workers, len(tables) - len(empty_tables))
+            snapshot_id: str | None = None
+            if parallel and workers > 1:
+                snapshot_id = conn.execute(
+                    text("SELECT pg_export_snapshot()")
+                ).scalar_one()
+                logger.info(f"Dumping tables with {workers} workers")
+
+            # ファイル名生成
+            timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"backup_{timestamp_str}{BACKUP_FILE_SUFFIX}"
+            output_path = output_dir / filename
+
+            # BackupDataと同じ構造のJSONをテーブル単位で圧縮ストリームへ書き出す
+            # （バックアップ全体のJSONをメモリ上に保持しない）
+            compressor = zstandard.ZstdCompressor(
+                level=settings.BACKUP_COMPRESSION_LEVEL, threads=-1
+            )
+            with (
+                output_path.open("wb", buffering=_IO_BUFFER_SIZE) as f,
+                compressor.stream_writer(f, closefd=False) as zf,
+            ):
+                writer = _CountingWriter(zf)
+                writer.write(b'{"metadata":')
+                writer.write(metadata.model_dump_json().encode("utf-8"))
+                writer.write(b',"tables":{')
+                total_rows = _write_tables(
+                    writer, conn, tables, empty_tables, snapshot_id, workers
+                )
+                writer.write(b"}}")
+
+        json_size_kb = writer.bytes_written / 1024
+        compressed_size_kb = output_path.stat().st_size / 1024
+
+        logger.info(f"Total: {len(table_names)} tables, {total_rows} rows")
         logger.info(
             f"Backup size: {json_size_kb:.2f} KB → {compressed_size_kb:.2f} KB (compressed)"
         )
@@ -227,39 +699,80 @@ def create_backup(output_dir: Path | None = None) -> Path:
 
     except Exception as e:
         logger.error(f"Failed to create backup: {e}")
+        # 書きかけのファイルを残さない
+        if output_path is not None:
+            output_path.unlink(missing_ok=True)
         raise RuntimeError(f"Failed to create backup: {e}") from e
 
 
-def calculate_diff(backup_path: Path) -> DiffSummary:
+def _count_rows(conn: Connection, table_name: str) -> int:
     """
-    バックアップファイルと現在のデータベースの差分を計算する
+    テーブルの行数をCOUNT(*)で正確に取得する
 
     Args:
-        backup_path: バックアップファイルのパス
+        conn: データベース接続
+        table_name: テーブル名
 
     Returns:
-        DiffSummary: 差分サマリ
+        int: 行数
+    """
+    # リフレクション済みTableオブジェクトを取得（安全なクエリ構築のため）
+    table_obj = _get_table(conn, table_name)
+    stmt = select(func.count()).select_from(table_obj)
+    result = conn.execute(stmt).fetchone()
+    return result[0] if result else 0
 
-    Raises:
-        RuntimeError: 差分計算に失敗した場合
+
+def _fast_row_counts(conn: Connection, table_names: list[str]) -> dict[str, int]:
     """
-    try:
-        settings = get_settings()
+    pg_classの統計情報からテーブルの推定行数を一括取得する
 
-        # バックアップファイルを読み込み
-        if not backup_path.exists():
-            raise FileNotFoundError(f"Backup file not found: {backup_path}")
+    COUNT(*)によるフルスキャンを行わないため高速だが、値は直近の
+    VACUUM/ANALYZE時点の推定値であり正確ではない。
 
-        compressed_data = backup_path.read_bytes()
-        json_data = gzip.decompress(compressed_data).decode("utf-8")
-        backup_data = BackupData.model_validate_json(json_data)
+    Args:
+        conn: データベース接続（PostgreSQL）
+        table_names: 対象テーブル名のリスト
 
-        logger.info(f"Calculating diff with backup: {backup_path.name}")
-        logger.info(f"Backup created at: {backup_data.metadata.timestamp.isoformat()}")
+    Returns:
+        dict[str, int]: テーブル名をキー、推定行数を値とする辞書
+            （統計情報が未収集のテーブルは含まれない）
+    """
+    result = conn.execute(
+        text(
+            "SELECT c.relname, c.reltuples::bigint FROM pg_class c "
+            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = current_schema() "
+            "AND c.relname = ANY(:names) AND c.relkind = 'r'"
+        ),
+        {"names": table_names},
+    )
+    # reltuples = -1 は未ANALYZEを表すため除外（呼び出し側でCOUNT(*)にフォールバック）
+    return {str(name): int(count) for name, count in result if count >= 0}
+
+
+def _diff_with_database(backup_data: BackupData, exact: bool = True) -> DiffSummary:
+    """
+    読み込み済みのバックアップデータと現在のデータベースの差分を計算する
+
+    Args:
+        backup_data: 検証済みのバックアップデータ
+        exact: Trueの場合はCOUNT(*)で正確な行数を取得する。
+            Falseの場合は統計情報による推定行数を使用する
 
-        # 現在のデータベースに接続
-        engine = create_engine(settings.database_uri)
-        inspector = inspect(engine)
+    Returns:
+        DiffSummary: 差分サマリ
+    """
+    # 現在のデータベースに接続（全テーブルで単一の接続を再利用）
+    engine = _get_engine(get_settings().database_uri)
+    with engine.connect() as conn:
+        inspector = inspect(conn)
+        current_table_names = set(inspector.get_table_names())
+
+        # 推定行数を一括取得（PostgreSQL以外では常にCOUNT(*)を使用）
+        estimated_rows: dict[str, int] = {}
+        if not exact and engine.dialect.name == "postgresql":
+            estimated_rows = _fast_row_counts(conn, sorted(current_table_names))
 
         # テーブルごとの差分を計算
         table_diffs: dict[str, TableDiff] = {}
@@ -271,14 +784,10 @@ def calculate_diff(backup_path: Path) -> DiffSummary:
             backup_rows = table_backup.row_count
 
             # 現在のテーブルの行数を取得
-            if table_name in inspector.get_table_names():
-                with engine.connect() as conn:
-                    # 動的にTableオブジェクトを作成（安全なクエリ構築のため）
-                    table_meta = MetaData()
-                    table_obj = Table(table_name, table_meta, autoload_with=engine)
-                    stmt = select(func.count()).select_from(table_obj)
-                    result = conn.execute(stmt).fetchone()
-                    current_rows = result[0] if result else 0
+            if table_name in estimated_rows:
+                current_rows = estimated_rows[table_name]
+            elif table_name in current_table_names:
+                current_rows = _count_rows(conn, table_name)
             else:
                 # テーブルが存在しない場合
                 current_rows = 0
@@ -293,34 +802,56 @@ def calculate_diff(backup_path: Path) -> DiffSummary:
             total_backup_rows += backup_rows
 
         # 現在のデータベースにのみ存在するテーブル
-        current_table_names = set(inspector.get_table_names())
         backup_table_names = set(backup_data.tables.keys())
         only_in_current = current_table_names - backup_table_names - {"alembic_version"}
 
         for table_name in only_in_current:
-            with engine.connect() as conn:
-                # 動的にTableオブジェクトを作成（安全なクエリ構築のため）
-                table_meta = MetaData()
-                table_obj = Table(table_name, table_meta, autoload_with=engine)
-                stmt = select(func.count()).select_from(table_obj)
-                result = conn.execute(stmt).fetchone()
-                current_rows = result[0] if result else 0
+            if table_name in estimated_rows:
+                current_rows = estimated_rows[table_name]
+            else:
+                current_rows = _count_rows(conn, table_name)
 
             table_diffs[table_name] = TableDiff(
                 current_rows=current_rows, backup_rows=0, diff=-current_rows
             )
             total_current_rows += current_rows
 
-        # サマリ作成
-        total_diff = total_backup_rows - total_current_rows
-        diff_summary = DiffSummary(
-            tables=table_diffs,
-            total_current_rows=total_current_rows,
-            total_backup_rows=total_backup_rows,
-            total_diff=total_diff,
-        )
+    # サマリ作成
+    total_diff = total_backup_rows - total_current_rows
+    diff_summary = DiffSummary(
+        tables=table_diffs,
+        total_current_rows=total_current_rows,
+        total_backup_rows=total_backup_rows,
+        total_diff=total_diff,
+    )
+
+    return diff_summary
+
+
+def calculate_diff(backup_path: Path, exact: bool = True) -> DiffSummary:
+    """
+    バックアップファイルと現在のデータベースの差分を計算する
 
-        return diff_summary
+    Args:
+        backup_path: バックアップファイルのパス
+        exact: Trueの場合はCOUNT(*)で正確な行数を取得する。
+            Falseの場合はPostgreSQLの統計情報（pg_class.reltuples）による
+            推定行数を使用する（大きなテーブルでも高速だが近似値）
+
+    Returns:
+        DiffSummary: 差分サマリ
+
+    Raises:
+        RuntimeError: 差分計算に失敗した場合
+    """
+    try:
+        # バックアップファイルを読み込み
+        backup_data = _read_backup_data(backup_path)
+
+        logger.info(f"Calculating diff with backup: {backup_path.name}")
+        logger.info(f"Backup created at: {backup_data.metadata.timestamp.isoformat()}")
+
+        return _diff_with_database(backup_data, exact)
 
     except Exception as e:
         logger.error(f"Failed to calculate diff: {e}")
@@ -342,10 +873,11 @@ def _deserialize_value(value: Any, column_type: str | None = None) -> Any:
         return None
 
     # バイナリデータの復元
+    if isinstance(value, str) and value.startswith(_BYTES_PREFIX):
+        return binascii.a2b_base64(value[len(_BYTES_PREFIX) :])
+    # 旧形式（フォーマットバージョン1.0）のバイナリデータ
     if isinstance(value, dict) and value.get("__type__") == "bytes":
-        import base64
-
-        return base64.b64decode(value["data"])
+        return binascii.a2b_base64(value["data"])
 
     # datetimeの復元（文字列からdatetimeオブジェクトへ）
     if isinstance(value, str) and column_type and "timestamp" in column_type.lower():
@@ -359,6 +891,53 @@ def _deserialize_value(value: Any, column_type: str | None = None) -> Any:
     return value
 
 
+def _insert_rows(
+    conn: Connection, table_obj: Table, columns: list[str], rows: list[list[Any]]
+) -> None:
+    """
+    バックアップの行データをテーブルに一括INSERTする
+
+    psycopg2使用時はexecute_valuesで複数行を1文の
+    INSERT ... VALUES (...), (...) にまとめ、_INSERT_PAGE_SIZE行ごとに
+    1往復で送信する。それ以外のドライバではSQLAlchemyのexecutemanyを使用する。
+
+    Args:
+        conn: データベース接続（トランザクション内）
+        table_obj: 投入先のTableオブジェクト
+        columns: カラム名のリスト（rowsの各要素と同じ順序）
+        rows: 行データのリスト（バックアップ時にシリアライズされた値）
+    """
+    if conn.dialect.driver != "psycopg2":
+        conn.execute(
+            table_obj.insert(),
+            [dict(zip(columns, [_deserialize_value(v) for v in row])) for row in rows],
+        )
+        return
+
+    # JSON/JSONBカラムはpsycopg2のJsonアダプタで包む（dict/listをそのまま渡せないため）
+    json_indexes = [
+        i for i, name in enumerate(columns) if isinstance(table_obj.c[name].type, JSON)
+    ]
+
+    values: list[tuple[Any, ...]] = []
+    for row in rows:
+        deserialized = [_deserialize_value(v) for v in row]
+        for i in json_indexes:
+            if deserialized[i] is not None:
+                deserialized[i] = Json(deserialized[i])
+        values.append(tuple(deserialized))
+
+    stmt = sql.SQL("INSERT INTO {} ({}) VALUES %s").format(
+        sql.Identifier(table_obj.name),
+        sql.SQL(", ").join(sql.Identifier(name) for name in columns),
+    )
+    cursor = conn.connection.cursor()
+    try:
+        execute_values(cursor, stmt, values, page_size=_INSERT_PAGE_SIZE)
+    finally:
+        cursor.close()
+
+
 def restore_backup(backup_path: Path, show_diff: bool = True) -> RestoreResult:
     """
     バックアップからデータベースをリストアする
@@ -379,12 +958,7 @@ def restore_backup(backup_path: Path, show_diff: bool = True) -> RestoreResult:
         settings = get_settings()
 
         # バックアップファイルを読み込み
-        if not backup_path.exists():
-            raise FileNotFoundError(f"Backup file not found: {backup_path}")
-
-        compressed_data = backup_path.read_bytes()
-        json_data = gzip.decompress(compressed_data).decode("utf-8")
-        backup_data = BackupData.model_validate_json(json_data)
+        backup_data = _read_backup_data(backup_path)
 
         logger.info(f"Restoring from backup: {backup_path.name}")
         logger.info(f"Backup created at: {backup_data.metadata.timestamp.isoformat()}")
@@ -393,7 +967,8 @@ def restore_backup(backup_path: Path, show_diff: bool = True) -> RestoreResult:
         # Diffを計算（オプション）
         if show_diff:
             logger.info("Calculating diff before restore...")
-            diff_summary = calculate_diff(backup_path)
+            # 読み込み済みのデータを使い、ファイルの再読み込み・再検証を避ける
+            diff_summary = _diff_with_database(backup_data)
 
             for table_name, table_diff in diff_summary.tables.items():
                 sign = "+" if table_diff.diff > 0 else ""
@@ -403,29 +978,34 @@ def restore_backup(backup_path: Path, show_diff: bool = True) -> RestoreResult:
 
         # データベースに接続してリストアを実行
 
-        engine = create_engine(settings.database_uri)
+        engine = _get_engine(settings.database_uri)
 
         with engine.begin() as conn:  # トランザクション開始
             logger.info("Starting restore transaction...")
 
             # 1. 全テーブルをTRUNCATE
-            inspector = inspect(engine)
-            table_names = inspector.get_table_names()
+            inspector = inspect(conn)
+            table_names = [
+                name
+                for name in inspector.get_table_names()
+                if name != "alembic_version"
+            ]
+
+            # リフレクション済みTableオブジェクトを使用（安全なクエリ構築のため）
+            # キャッシュを使わず現在のスキーマを読み直し、マイグレーション後の
+            # カラム追加・型変更を取りこぼさないようにする
+            reflected = _reflect_tables(conn, table_names)
 
             for table_name in table_names:
-                if table_name == "alembic_version":
-                    continue
                 logger.info(f"Truncating table: {table_name}")
-                # 動的にTableオブジェクトを作成（安全なクエリ構築のため）
-                table_meta = MetaData()
-                table_obj = Table(table_name, table_meta, autoload_with=engine)
+                table_obj = reflected.tables[table_name]
                 # DELETEを使用（TRUNCATEのSQLAlchemy代替）
                 delete_stmt = delete(table_obj)
                 conn.execute(delete_stmt)
 
             # 2. マイグレーションバージョンを調整
             target_version = backup_data.metadata.migration_version
-            current_version = get_current_migration_version()
+            current_version = _read_migration_version(conn)
 
             if target_version != current_version:
                 logger.info(
@@ -462,20 +1042,10 @@ def restore_backup(backup_path: Path, show_diff: bool = True) -> RestoreResult:
                 # カラム名を取得
                 columns = table_backup.columns
 
-                # 動的にTableオブジェクトを作成（安全なクエリ構築のため）
-                table_meta = MetaData()
-                table_obj = Table(table_name, table_meta, autoload_with=engine)
-
-                # 各行をINSERT（SQLAlchemyのinsert()を使用）
-                for row_data in table_backup.data:
-                    # 辞書形式に変換
-                    row_dict = dict(zip(columns, row_data))
-                    # デシリアライズ（バックアップ時にシリアライズされた値を復元）
-                    deserialized_dict = {
-                        k: _deserialize_value(v) for k, v in row_dict.items()
-                    }
-                    insert_stmt = table_obj.insert().values(**deserialized_dict)
-                    conn.execute(insert_stmt)
+                table_obj = reflected.tables[table_name]
+
+                # 全行を一括INSERT
+                _insert_rows(conn, table_obj, columns, table_backup.data)
 
                 total_restored_rows += table_backup.row_count
                 total_restored_tables += 1
@@ -19,7 +19,7 @@ class BackupMetadata(BaseModel):
     """
 
     version: str = Field(
-        default="1.0", description="バックアップフォーマットのバージョン"
+        default="1.1", description="バックアップフォーマットのバージョン"
     )
     timestamp: datetime = Field(description="バックアップ作成日時")
     migration_version: str = Field(description="Alembicマイグレーションのリビジョン")
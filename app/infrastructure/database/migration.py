@@ -6,13 +6,12 @@ FastAPIアプリケーション起動時にAlembicマイグレーションを
 """
 
 import logging
-from pathlib import Path
 
 from alembic import command
-from alembic.config import Config
 
 from app.core.config import Settings, get_settings
 from app.core.logging import get_logger
+from app.infrastructure.database.alembic_config import get_alembic_config
 
 
 def _configure_migration_logging(settings: Settings) -> None:
@@ -49,28 +48,6 @@ def _configure_migration_logging(settings: Settings) -> None:
         sqlalchemy_logger.setLevel(logging.WARNING)  # 本番環境: 警告のみ
 
 
-def _create_alembic_config(settings: Settings) -> Config:
-    """
-    Alembic設定オブジェクトを作成する。
-
-    Args:
-        settings: アプリケーション設定
-
-    Returns:
-        Config: Alembic設定オブジェクト
-    """
-    alembic_cfg = Config()
-
-    # スクリプトディレクトリの絶対パスを設定
-    script_location = (Path(__file__).parent / "alembic").resolve()
-    alembic_cfg.set_main_option("script_location", str(script_location))
-
-    # データベースURLを設定
-    alembic_cfg.set_main_option("sqlalchemy.url", settings.database_uri)
-
-    return alembic_cfg
-
-
 def run_migrations(logger_key: str | None = None) -> None:
     """
     データベースマイグレーションを実行
@@ -90,12 +67,13 @@ def run_migrations(logger_key: str | None = None) -> None:
         _configure_migration_logging(settings)
 
         # Alembic設定を作成
-        alembic_cfg = _create_alembic_config(settings)
+        alembic_cfg = get_alembic_config(settings.database_uri)
 
         # マイグレーション開始ログ
-        script_location = (Path(__file__).parent / "alembic").resolve()
         logger.info("Starting database migrations...")
-        logger.info(f"Script location: {script_location}")
+        logger.info(
+            f"Script location: {alembic_cfg.get_main_option('script_location')}"
+        )
         logger.info(
             f"Database: {settings.POSTGRES_HOST}:{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}"
         )
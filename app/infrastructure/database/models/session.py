@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, String, Text
+from sqlalchemy import DateTime, LargeBinary, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, TimeStampMixin
@@ -21,7 +21,7 @@ class Session(Base, TimeStampMixin):
     __tablename__ = "sessions"
 
     session_id: Mapped[str] = mapped_column(String(128), primary_key=True, index=True)
-    data: Mapped[str] = mapped_column(Text, nullable=False)  # 暗号化されたJSON
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)  # 暗号化されたJSON
     expires_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, index=True
     )
@@ -8,10 +8,14 @@ RDBベースのセッション管理を提供
 - 期限切れセッションの自動削除
 """
 
+import threading
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
-from typing import Any, Optional, cast
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional, cast
 
-from sqlalchemy import delete
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session as DBSession
 
 from ...core.config import get_settings
@@ -19,32 +23,163 @@ from ...core.logging import get_logger
 from ..database.models.session import Session
 from ..security.encryption import (
     SessionEncryption,
+    compare_fingerprint,
     generate_csrf_token,
     generate_fingerprint,
     generate_session_id,
     get_session_encryption,
-    verify_fingerprint,
 )
 
 logger = get_logger(__name__)
 
+# 期限切れセッションのクリーンアップで1回のDELETEに含める最大行数
+_CLEANUP_BATCH_SIZE = 10_000
+
+
+class CachedSession(NamedTuple):
+    """キャッシュに保持するセッションレコード（データは暗号化されたまま保持）"""
+
+    data: bytes
+    expires_at: datetime
+    fingerprint: str
+    csrf_token: str
+
+
+class SessionCache:
+    """
+    プロセス内のセッションキャッシュ（TTL付きLRU）
+
+    セッションの読み込み時のDB問い合わせを省略するために使用する。
+    データは暗号化されたまま保持し、取得時に復号する。
+    キャッシュはプロセスごとに独立しているため、他のプロセスでの更新・削除は
+    最大でTTL秒だけ反映されない。
+    """
+
+    def __init__(self, ttl: float, max_size: int):
+        """
+        Args:
+            ttl: キャッシュの有効期間（秒）、0以下の場合はキャッシュしない
+            max_size: 最大件数（超過した場合は最も古く参照されたものから破棄）
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.enabled = ttl > 0 and max_size > 0
+        self._entries: OrderedDict[str, tuple[float, CachedSession]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> CachedSession | None:
+        """
+        キャッシュされたセッションを取得
+
+        Args:
+            session_id: セッションID
+
+        Returns:
+            キャッシュされたセッション、存在しないまたは有効期間切れの場合はNone
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            cached_until, session = entry
+            if cached_until < time.monotonic():
+                del self._entries[session_id]
+                return None
+            self._entries.move_to_end(session_id)
+            return session
+
+    def set(self, session_id: str, session: CachedSession) -> None:
+        """
+        セッションをキャッシュに保存
+
+        Args:
+            session_id: セッションID
+            session: キャッシュするセッション
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[session_id] = (time.monotonic() + self.ttl, session)
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, session_id: str) -> None:
+        """
+        セッションをキャッシュから削除
+
+        Args:
+            session_id: セッションID
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def clear(self) -> None:
+        """キャッシュを全て削除"""
+        with self._lock:
+            self._entries.clear()
+
+
+@lru_cache(maxsize=1)
+def get_session_cache() -> SessionCache:
+    """
+    SessionCacheのシングルトンインスタンスを取得（キャッシュ）
+
+    Returns:
+        SessionCacheインスタンス
+    """
+    settings = get_settings()
+    return SessionCache(settings.SESSION_CACHE_TTL, settings.SESSION_CACHE_MAX_SIZE)
+
 
 class SessionService:
     """
     セッション管理サービス
     """
 
-    def __init__(self, db: DBSession, encryption: Optional["SessionEncryption"] = None):
+    def __init__(
+        self,
+        db: DBSession,
+        encryption: Optional["SessionEncryption"] = None,
+        cache: SessionCache | None = None,
+    ):
         """
         Args:
             db: DBセッション
             encryption: 暗号化インスタンス（Noneの場合はデフォルト取得）
+            cache: セッションキャッシュ（Noneの場合はデフォルト取得）
         """
         self.db = db
         # 依存性注入: テスト時はモックインスタンスを渡せる
         self.encryption = (
             encryption if encryption is not None else get_session_encryption()
         )
+        self.cache = cache if cache is not None else get_session_cache()
+
+    def _load_session(self, session_id: str) -> Session | CachedSession | None:
+        """
+        セッションレコードをキャッシュまたはDBから取得
+
+        Args:
+            session_id: セッションID
+
+        Returns:
+            セッションレコード、存在しない場合はNone
+        """
+        cached = self.cache.get(session_id)
+        if cached is not None:
+            return cached
+
+        session = (
+            self.db.query(Session).filter(Session.session_id == session_id).first()
+        )
+        if session is not None:
+            self.cache.set(session_id, _to_cached_session(session))
+        return session
 
     def create_session(
         self,
@@ -52,6 +187,7 @@ class SessionService:
         user_agent: str | None = None,
         client_ip: str | None = None,
         expire_seconds: int | None = None,
+        fingerprint: str | None = None,
     ) -> tuple[str, str]:
         """
         新しいセッションを作成
@@ -61,13 +197,15 @@ class SessionService:
             user_agent: User-Agentヘッダー
             client_ip: クライアントIPアドレス
             expire_seconds: 有効期限（秒）、Noneの場合は設定値を使用
+            fingerprint: 計算済みのフィンガープリント（Noneの場合はUser-Agent・IPから生成）
 
         Returns:
             (session_id, csrf_token) のタプル
         """
         session_id = generate_session_id()
         csrf_token = generate_csrf_token()
-        fingerprint = generate_fingerprint(user_agent, client_ip)
+        if fingerprint is None:
+            fingerprint = generate_fingerprint(user_agent, client_ip)
 
         if expire_seconds is None:
             settings = get_settings()
@@ -86,6 +224,11 @@ class SessionService:
 
         self.db.add(session)
         self.db.commit()
+        # コミット後の属性アクセスは再読み込みが発生するため、作成時の値をキャッシュする
+        self.cache.set(
+            session_id,
+            CachedSession(encrypted_data, expires_at, fingerprint, csrf_token),
+        )
 
         logger.info(f"Session created: {session_id}")
         return session_id, csrf_token
@@ -97,6 +240,7 @@ class SessionService:
         client_ip: str | None = None,
         verify_csrf: bool = False,
         csrf_token: str | None = None,
+        fingerprint: str | None = None,
     ) -> dict[str, Any] | None:
         """
         セッションを取得
@@ -107,13 +251,12 @@ class SessionService:
             client_ip: クライアントIPアドレス（フィンガープリント検証用）
             verify_csrf: CSRFトークンを検証するか
             csrf_token: CSRFトークン（verify_csrf=Trueの場合必須）
+            fingerprint: 計算済みのフィンガープリント（Noneの場合はUser-Agent・IPから生成）
 
         Returns:
             セッションデータ、存在しないまたは無効な場合はNone
         """
-        session = (
-            self.db.query(Session).filter(Session.session_id == session_id).first()
-        )
+        session = self._load_session(session_id)
 
         if not session:
             logger.debug(f"Session not found: {session_id}")
@@ -124,7 +267,9 @@ class SessionService:
             self.delete_session(session_id)
             return None
 
-        if not verify_fingerprint(session.fingerprint, user_agent, client_ip):
+        if fingerprint is None:
+            fingerprint = generate_fingerprint(user_agent, client_ip)
+        if not compare_fingerprint(session.fingerprint, fingerprint):
             logger.warning(f"Session fingerprint mismatch: {session_id}")
             # セキュリティ上、セッションを削除
             self.delete_session(session_id)
@@ -153,6 +298,7 @@ class SessionService:
         data: dict[str, Any],
         user_agent: str | None = None,
         client_ip: str | None = None,
+        fingerprint: str | None = None,
     ) -> bool:
         """
         セッションデータを更新
@@ -162,6 +308,7 @@ class SessionService:
             data: 新しいセッションデータ
             user_agent: User-Agentヘッダー（フィンガープリント検証用）
             client_ip: クライアントIPアドレス（フィンガープリント検証用）
+            fingerprint: 計算済みのフィンガープリント（Noneの場合はUser-Agent・IPから生成）
 
         Returns:
             更新成功時True、失敗時False
@@ -179,7 +326,9 @@ class SessionService:
             self.delete_session(session_id)
             return False
 
-        if not verify_fingerprint(session.fingerprint, user_agent, client_ip):
+        if fingerprint is None:
+            fingerprint = generate_fingerprint(user_agent, client_ip)
+        if not compare_fingerprint(session.fingerprint, fingerprint):
             logger.warning(
                 f"Cannot update session with fingerprint mismatch: {session_id}"
             )
@@ -190,12 +339,16 @@ class SessionService:
             encrypted_data = self.encryption.encrypt(data)
             session.data = encrypted_data
             session.updated_at = datetime.now(UTC)
+            # コミット後の属性アクセスは再読み込みが発生するため、コミット前に変換する
+            cached = _to_cached_session(session)
             self.db.commit()
+            self.cache.set(session_id, cached)
             logger.info(f"Session updated: {session_id}")
             return True
         except Exception as e:
             logger.error(f"Failed to update session {session_id}: {e}")
             self.db.rollback()
+            self.cache.invalidate(session_id)
             return False
 
     def delete_session(self, session_id: str) -> bool:
@@ -208,6 +361,7 @@ class SessionService:
         Returns:
             削除成功時True、失敗時False
         """
+        self.cache.invalidate(session_id)
         try:
             result = self.db.execute(
                 delete(Session).where(Session.session_id == session_id)
@@ -227,28 +381,48 @@ class SessionService:
         """
         期限切れセッションをクリーンアップ
 
+        行ロックの保持時間を抑えるため、_CLEANUP_BATCH_SIZE件ずつ
+        削除・コミットを繰り返す。
+
         Returns:
             削除されたセッション数
         """
+        now = datetime.now(UTC)
+        # expires_atのインデックスで対象を絞り込み、1回の削除件数を制限する
+        expired_ids = (
+            select(Session.session_id)
+            .where(Session.expires_at < now)
+            .limit(_CLEANUP_BATCH_SIZE)
+            .scalar_subquery()
+        )
+        stmt = delete(Session).where(Session.session_id.in_(expired_ids))
+
+        count = 0
         try:
-            result = self.db.execute(
-                delete(Session).where(Session.expires_at < datetime.now(UTC))
-            )
-            self.db.commit()
-            count = cast(int, getattr(result, "rowcount", 0))
-            if count > 0:
-                logger.info(f"Cleaned up {count} expired sessions")
-            return count
+            while True:
+                # ORMのidentity mapとの同期は不要（Core DELETEとして実行）
+                result = self.db.execute(
+                    stmt, execution_options={"synchronize_session": False}
+                )
+                self.db.commit()
+                deleted = cast(int, getattr(result, "rowcount", 0))
+                count += deleted
+                if deleted < _CLEANUP_BATCH_SIZE:
+                    break
         except Exception as e:
             logger.error(f"Failed to cleanup expired sessions: {e}")
             self.db.rollback()
-            return 0
+
+        if count > 0:
+            logger.info(f"Cleaned up {count} expired sessions")
+        return count
 
     def regenerate_session_id(
         self,
         old_session_id: str,
         user_agent: str | None = None,
         client_ip: str | None = None,
+        fingerprint: str | None = None,
     ) -> tuple[str, str] | None:
         """
         セッションIDを再生成（セッション固定攻撃対策）
@@ -259,11 +433,18 @@ class SessionService:
             old_session_id: 古いセッションID
             user_agent: User-Agentヘッダー
             client_ip: クライアントIPアドレス
+            fingerprint: 計算済みのフィンガープリント（Noneの場合はUser-Agent・IPから生成）
 
         Returns:
             (新しいsession_id, 新しいcsrf_token) のタプル、失敗時はNone
         """
-        data = self.get_session(old_session_id, user_agent, client_ip)
+        # 検証と新しいセッションの作成で同じフィンガープリントを使用する
+        if fingerprint is None:
+            fingerprint = generate_fingerprint(user_agent, client_ip)
+
+        data = self.get_session(
+            old_session_id, user_agent, client_ip, fingerprint=fingerprint
+        )
         if data is None:
             logger.warning(f"Cannot regenerate non-existent session: {old_session_id}")
             return None
@@ -271,7 +452,7 @@ class SessionService:
         self.delete_session(old_session_id)
 
         new_session_id, new_csrf_token = self.create_session(
-            data, user_agent, client_ip
+            data, user_agent, client_ip, fingerprint=fingerprint
         )
 
         logger.info(f"Session ID regenerated: {old_session_id} -> {new_session_id}")
@@ -287,7 +468,23 @@ class SessionService:
         Returns:
             CSRFトークン、セッションが存在しない場合はNone
         """
-        session = (
-            self.db.query(Session).filter(Session.session_id == session_id).first()
-        )
+        session = self._load_session(session_id)
         return session.csrf_token if session else None
+
+
+def _to_cached_session(session: Session) -> CachedSession:
+    """
+    セッションレコードをキャッシュ用の値に変換
+
+    Args:
+        session: セッションレコード
+
+    Returns:
+        キャッシュ用のセッション
+    """
+    return CachedSession(
+        data=session.data,
+        expires_at=session.expires_at,
+        fingerprint=session.fingerprint,
+        csrf_token=session.csrf_token,
+    )
@@ -4,12 +4,19 @@
 セッション暗号化、CSRF保護、セッションフィンガープリント生成など
 """
 
+import base64
 import hashlib
-import json
+import os
 import secrets
-from typing import Any
+from functools import lru_cache
+from typing import Any, Protocol
 
+import orjson
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
 from ...core.config import get_settings
 from ...core.logging import get_logger
@@ -17,40 +24,172 @@ from ...core.logging import get_logger
 logger = get_logger(__name__)
 
 
+# AES-GCM形式の暗号文の先頭に付与するバージョンバイト
+# （FernetトークンはBase64文字列のため、この値で始まることはない）
+_AESGCM_VERSION = b"\x01"
+_AESGCM_NONCE_SIZE = 12
+
+# フィンガープリント生成用の初期化済みSHA-256オブジェクト
+# （copy()は新規生成よりも初期化コストが小さい）
+_SHA256_BASE = hashlib.sha256()
+
+
+class SessionCipher(Protocol):
+    """セッションデータの暗号化に使用する暗号器"""
+
+    def encrypt(self, data: bytes) -> bytes: ...
+
+    def decrypt(self, token: bytes) -> bytes: ...
+
+
+class AESGCMCipher:
+    """
+    AES-256-GCMによる暗号器
+
+    暗号文はバージョンバイト + nonce(12バイト) + 暗号文・認証タグの生のバイト列。
+    FernetのBase64エンコード・タイムスタンプ・HMACを含まない
+    """
+
+    def __init__(self, encryption_key: str):
+        # Fernet形式のキー（32バイト）からAES-256の鍵を導出する
+        hkdf = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b"session-data-aes-gcm",
+        )
+        self._aesgcm = AESGCM(hkdf.derive(base64.urlsafe_b64decode(encryption_key)))
+
+    def encrypt(self, data: bytes) -> bytes:
+        nonce = os.urandom(_AESGCM_NONCE_SIZE)
+        return _AESGCM_VERSION + nonce + self._aesgcm.encrypt(nonce, data, None)
+
+    def decrypt(self, token: bytes) -> bytes:
+        if not token.startswith(_AESGCM_VERSION):
+            raise InvalidToken
+        header_size = len(_AESGCM_VERSION) + _AESGCM_NONCE_SIZE
+        try:
+            return self._aesgcm.decrypt(
+                token[len(_AESGCM_VERSION) : header_size], token[header_size:], None
+            )
+        except InvalidTag as e:
+            raise InvalidToken from e
+
+
+class CryptographyFernetCipher:
+    """
+    cryptographyパッケージのFernetによる暗号器
+
+    トークンの組み立て（HMAC・Base64・タイムスタンプ）はPythonで実装されている
+    """
+
+    def __init__(self, encryption_key: str):
+        self._fernet = Fernet(encryption_key.encode())
+
+    def encrypt(self, data: bytes) -> bytes:
+        return self._fernet.encrypt(data)
+
+    def decrypt(self, token: bytes) -> bytes:
+        return self._fernet.decrypt(token)
+
+
+class RFernetCipher:
+    """
+    rfernet（Rust実装のFernet）による暗号器
+
+    トークン形式はcryptographyのFernetと同一のため、相互に復号できる
+    """
+
+    def __init__(self, encryption_key: str):
+        import rfernet
+
+        self._fernet = rfernet.Fernet(encryption_key)
+        self._decryption_error = rfernet.DecryptionError
+
+    def encrypt(self, data: bytes) -> bytes:
+        return self._fernet.encrypt(data).encode("ascii")
+
+    def decrypt(self, token: bytes) -> bytes:
+        try:
+            return self._fernet.decrypt(token.decode("ascii"))
+        except (self._decryption_error, UnicodeDecodeError) as e:
+            raise InvalidToken from e
+
+
+def create_fernet_cipher(encryption_key: str, backend: str = "auto") -> SessionCipher:
+    """
+    Fernet形式の暗号器を生成
+
+    Args:
+        encryption_key: 暗号化キー（Fernet形式）
+        backend: 実装（auto / rfernet / cryptography）。
+            autoの場合はrfernetを優先し、利用できなければcryptographyを使用する
+
+    Returns:
+        Fernet形式の暗号器
+
+    Raises:
+        ImportError: backend="rfernet"でrfernetが利用できない場合
+    """
+    if backend == "cryptography":
+        return CryptographyFernetCipher(encryption_key)
+    if backend == "rfernet":
+        return RFernetCipher(encryption_key)
+
+    try:
+        return RFernetCipher(encryption_key)
+    except ImportError:
+        logger.info("rfernet is not available, falling back to cryptography")
+        return CryptographyFernetCipher(encryption_key)
+
+
 class SessionEncryption:
     """
     セッションデータの暗号化/復号化
 
-    Fernet (対称暗号化) を使用してセッションデータを安全に保存
+    AES-256-GCM (対称暗号化) を使用してセッションデータを安全に保存。
+    以前のFernet形式で暗号化されたデータも復号できる
     """
 
-    def __init__(self, encryption_key: str | None = None):
+    def __init__(self, encryption_key: str | None = None, backend: str | None = None):
         """
         Args:
             encryption_key: 暗号化キー（Noneの場合は設定から取得）
+            backend: 暗号化に使用する形式・実装（Noneの場合は設定から取得）
+
+        Raises:
+            ImportError: backend="rfernet"でrfernetがインストールされていない場合
+            ValueError: 暗号化キーの形式が不正な場合
         """
         # 依存性注入: テスト時は明示的にキーを渡せる
         if encryption_key is None:
-            settings = get_settings()
-            encryption_key = settings.SESSION_ENCRYPTION_KEY
+            encryption_key = get_settings().SESSION_ENCRYPTION_KEY
+        if backend is None:
+            backend = get_settings().SESSION_ENCRYPTION_BACKEND
 
         # 空文字列もNoneとして扱う
         if not encryption_key:
             encryption_key = None
 
         self.encryption_key = encryption_key
-        self.cipher: Fernet | None
+        self.cipher: SessionCipher | None
         self.enabled: bool
+        self._aesgcm_cipher: SessionCipher | None = None
+        self._fernet_cipher: SessionCipher | None = None
 
         if self.encryption_key:
-            try:
-                self.cipher = Fernet(self.encryption_key.encode())
-                self.enabled = True
-                logger.info("Session encryption enabled")
-            except Exception as e:
-                logger.error(f"Failed to initialize session encryption: {e}")
-                self.cipher = None
-                self.enabled = False
+            # キーが設定されている場合は暗号化なしにフォールバックしない
+            # （不正なキーや利用できないbackendは起動時のエラーとして送出する）
+            # 復号時は暗号文の先頭バイトで形式を判別するため両方を用意する
+            self._aesgcm_cipher = AESGCMCipher(self.encryption_key)
+            self._fernet_cipher = create_fernet_cipher(
+                self.encryption_key, "auto" if backend == "aesgcm" else backend
+            )
+            self.cipher = (
+                self._aesgcm_cipher if backend == "aesgcm" else self._fernet_cipher
+            )
+            self.enabled = True
+            logger.info("Session encryption enabled")
         else:
             self.cipher = None
             self.enabled = False
@@ -58,7 +197,7 @@ class SessionEncryption:
                 "Session encryption disabled (SESSION_ENCRYPTION_KEY not set)"
             )
 
-    def encrypt(self, data: dict[str, Any]) -> str:
+    def encrypt(self, data: dict[str, Any]) -> bytes:
         """
         セッションデータを暗号化
 
@@ -66,28 +205,28 @@ class SessionEncryption:
             data: 暗号化するデータ（dict）
 
         Returns:
-            暗号化されたデータ（Base64エンコードされた文字列）
+            暗号化されたデータ（バイト列）
         """
         if not self.enabled or not self.cipher:
-            # 暗号化無効時はJSON文字列をそのまま返す（非推奨）
+            # 暗号化無効時はJSONをそのまま返す（非推奨）
             logger.warning("Storing session data without encryption")
-            return json.dumps(data, ensure_ascii=False)
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
 
         try:
-            # JSONシリアライズ → バイト列に変換 → 暗号化
-            json_str = json.dumps(data, ensure_ascii=False)
-            encrypted = self.cipher.encrypt(json_str.encode("utf-8"))
-            return encrypted.decode("utf-8")
+            # JSONシリアライズ（UTF-8のバイト列）→ 暗号化
+            return self.cipher.encrypt(
+                orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+            )
         except Exception as e:
             logger.error(f"Failed to encrypt session data: {e}")
             raise ValueError("Session encryption failed")
 
-    def decrypt(self, encrypted_data: str) -> dict[str, Any]:
+    def decrypt(self, encrypted_data: bytes) -> dict[str, Any]:
         """
         暗号化されたセッションデータを復号化
 
         Args:
-            encrypted_data: 暗号化されたデータ（Base64文字列）
+            encrypted_data: 暗号化されたデータ（AES-GCM形式またはFernetトークン）
 
         Returns:
             復号化されたデータ（dict）
@@ -95,20 +234,25 @@ class SessionEncryption:
         Raises:
             ValueError: 復号化に失敗した場合
         """
-        if not self.enabled or not self.cipher:
+        if not self.enabled or not self._aesgcm_cipher or not self._fernet_cipher:
             # 暗号化無効時はJSONパース
             try:
-                parsed_result: dict[str, Any] = json.loads(encrypted_data)
+                parsed_result: dict[str, Any] = orjson.loads(encrypted_data)
                 return parsed_result
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error(f"Failed to parse session data: {e}")
                 raise ValueError("Invalid session data")
 
         try:
-            # 復号化 → バイト列からデコード → JSONパース
-            decrypted = self.cipher.decrypt(encrypted_data.encode("utf-8"))
-            json_str = decrypted.decode("utf-8")
-            decrypted_result: dict[str, Any] = json.loads(json_str)
+            # 復号化 → JSONパース（バイト列のまま）
+            cipher = (
+                self._aesgcm_cipher
+                if encrypted_data.startswith(_AESGCM_VERSION)
+                else self._fernet_cipher
+            )
+            decrypted_result: dict[str, Any] = orjson.loads(
+                cipher.decrypt(encrypted_data)
+            )
             return decrypted_result
         except InvalidToken:
             logger.error("Invalid encryption token for session data")
@@ -125,17 +269,39 @@ def generate_csrf_token() -> str:
     Returns:
         ランダムな64文字のHEX文字列
     """
-    return secrets.token_hex(32)
+    # secrets.token_hex()と同じくos.urandomを使用し、bytes.hex()で直接HEX化する
+    return os.urandom(32).hex()
 
 
 def generate_session_id() -> str:
     """
     セッションIDを生成
 
+    Cookieとして毎リクエスト送信されるため、HEX表現より短いURLセーフなBase64で表現する。
+    既存の64文字HEXのセッションIDもそのまま検索できる。
+
     Returns:
-        ランダムな64文字のHEX文字列
+        ランダムな32バイトをURLセーフなBase64で表した43文字の文字列
     """
-    return secrets.token_hex(32)
+    return secrets.token_urlsafe(32)
+
+
+def log_hash_backend() -> None:
+    """
+    SHA-256の実装がOpenSSLによるものかをログに出力
+
+    OpenSSL実装はCPUのSHA拡張命令（SHA-NI等）を利用できるが、
+    Pythonの組み込み実装（_sha2）にフォールバックしている場合は大幅に遅くなる。
+    """
+    import ssl
+
+    if type(hashlib.sha256()).__module__ == "_hashlib":
+        logger.info(f"SHA-256 backend: {ssl.OPENSSL_VERSION}")
+    else:
+        logger.warning(
+            "SHA-256 backend: Python builtin implementation "
+            f"(OpenSSL is not used by hashlib; {ssl.OPENSSL_VERSION})"
+        )
 
 
 def generate_fingerprint(user_agent: str | None, client_ip: str | None) -> str:
@@ -155,7 +321,9 @@ def generate_fingerprint(user_agent: str | None, client_ip: str | None) -> str:
     ua = user_agent or "unknown"
     ip = client_ip or "unknown"
     fingerprint_str = f"{ua}|{ip}"
-    return hashlib.sha256(fingerprint_str.encode("utf-8")).hexdigest()
+    sha256 = _SHA256_BASE.copy()
+    sha256.update(fingerprint_str.encode("utf-8"))
+    return sha256.hexdigest()
 
 
 def verify_fingerprint(
@@ -172,22 +340,31 @@ def verify_fingerprint(
     Returns:
         フィンガープリントが一致する場合True
     """
-    current_fingerprint = generate_fingerprint(user_agent, client_ip)
-    return secrets.compare_digest(stored_fingerprint, current_fingerprint)
+    return compare_fingerprint(
+        stored_fingerprint, generate_fingerprint(user_agent, client_ip)
+    )
 
 
-# シングルトンインスタンス
-_session_encryption: SessionEncryption | None = None
+def compare_fingerprint(stored_fingerprint: str, current_fingerprint: str) -> bool:
+    """
+    計算済みのフィンガープリントを保存されているフィンガープリントと比較
+
+    Args:
+        stored_fingerprint: 保存されているフィンガープリント
+        current_fingerprint: 現在のリクエストから生成したフィンガープリント
+
+    Returns:
+        フィンガープリントが一致する場合True
+    """
+    return secrets.compare_digest(stored_fingerprint, current_fingerprint)
 
 
+@lru_cache(maxsize=1)
 def get_session_encryption() -> SessionEncryption:
     """
-    SessionEncryptionのシングルトンインスタンスを取得
+    SessionEncryptionのシングルトンインスタンスを取得（キャッシュ）
 
     Returns:
         SessionEncryptionインスタンス
     """
-    global _session_encryption
-    if _session_encryption is None:
-        _session_encryption = SessionEncryption()
-    return _session_encryption
+    return SessionEncryption()
@@ -2,6 +2,12 @@ from fastapi import APIRouter
 
 from . import system, v1
 
+# include_routerはルートごとにレスポンスモデル・依存関係を再生成するため、
+# ルーターを入れ子に登録せず、各パッケージのルーターをapi_routerへ1段階で登録する
 api_router = APIRouter(prefix="/api")
-api_router.include_router(v1.router, prefix="/v1")
-api_router.include_router(system.router, prefix="/system")
+for package_prefix, package_routers in (
+    ("/v1", v1.routers),
+    ("/system", system.routers),
+):
+    for router, prefix, tags in package_routers:
+        api_router.include_router(router, prefix=package_prefix + prefix, tags=[*tags])
@@ -1,3 +1,4 @@
+import hmac
 from collections.abc import Generator
 from dataclasses import dataclass
 from typing import Any
@@ -27,8 +28,9 @@ def get_session(request: Request) -> SessionSchema:
     if isinstance(session, SessionSchema):
         return session
     # dictの場合はSessionSchemaに変換
+    # セッションデータはミドルウェアで復号したdictのため、検証を省略して構築する
     session_data: dict[str, Any] = session if session is not None else {}
-    return SessionSchema(data=session_data)
+    return SessionSchema.model_construct(data=session_data)
 
 
 def get_db_with_session(
@@ -47,6 +49,7 @@ def get_db_with_session(
 api_key_header = APIKeyHeader(
     name="Authorization", scheme_name="Bearer", auto_error=False
 )
+_BEARER_PREFIX = "Bearer "
 
 
 def get_api_key(
@@ -66,14 +69,21 @@ def get_api_key(
         )
 
     # Bearerプレフィックスの処理
-    scheme, _, api_key = api_key_header.partition(" ")
-    if scheme.lower() != "bearer":
-        raise HTTPException(
-            status_code=HTTP_403_FORBIDDEN,
-            detail="Authorization header must start with 'Bearer'",
-        )
-
-    if not api_key or api_key != settings.API_KEY:
+    # 一般的な"Bearer "はスライスのみで取り出し、それ以外の表記（大文字小文字の違い等）のみ分割して判定する
+    if api_key_header.startswith(_BEARER_PREFIX):
+        api_key = api_key_header[len(_BEARER_PREFIX) :]
+    else:
+        scheme, _, api_key = api_key_header.partition(" ")
+        if scheme.lower() != "bearer":
+            raise HTTPException(
+                status_code=HTTP_403_FORBIDDEN,
+                detail="Authorization header must start with 'Bearer'",
+            )
+
+    # タイミング攻撃を防ぐため定数時間で比較する（非ASCII文字を含む場合に備えてバイト列で比較）
+    if not api_key or not hmac.compare_digest(
+        api_key.encode(), settings.API_KEY.encode()
+    ):
         raise HTTPException(status_code=HTTP_403_FORBIDDEN, detail="Invalid API key")
 
     return api_key
@@ -2,6 +2,9 @@ from fastapi import APIRouter
 
 from . import healthcheck, views
 
-router = APIRouter()
-router.include_router(healthcheck.router, prefix="/healthcheck", tags=["system"])
-router.include_router(views.router, prefix="/views", tags=["views"])
+# 登録するルーター（ルーター, プレフィックス, タグ）
+# api_routerへの登録はapp/presentation/api/__init__.pyでまとめて行う
+routers: list[tuple[APIRouter, str, list[str]]] = [
+    (healthcheck.router, "/healthcheck", ["system"]),
+    (views.router, "/views", ["views"]),
+]
@@ -1,44 +1,54 @@
+import asyncio
+import time
 from datetime import UTC, datetime
 
-from fastapi import APIRouter, Request, Response, status
+import anyio.to_thread
+import orjson
+from fastapi import APIRouter, FastAPI, Request, Response, status
 from sqlalchemy import text
-from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
-from app.infrastructure.database import get_db
+from app.infrastructure.database import SessionLocal
 from app.presentation.schemas.system import DatabaseStatus, HealthCheckResponse
 
 router = APIRouter()
 logger = get_logger(__name__)
 settings = get_settings()
 
+# DB接続チェック結果の再利用期間（秒）
+# 短い間隔でのヘルスチェックのたびにDBへ問い合わせないようにする
+_DB_PROBE_TTL = 5.0
+# DB接続チェックの待ち時間の上限（秒）
+# 応答しないDBへの問い合わせで後続のヘルスチェックが待たされ続けないようにする
+_DB_PROBE_TIMEOUT = 3.0
+_db_probe_cache: tuple[float, DatabaseStatus, bytes] | None = None
 
-@router.get("/", response_model=HealthCheckResponse)
-async def healthcheck(request: Request, response: Response) -> HealthCheckResponse:
-    """
-    ヘルスチェックエンドポイント
+# 正常時のレスポンスのうち、リクエストごとに変化しない部分（シリアライズ済み）
+_HEALTHY_BODY_PREFIX = b'{"status":"ok","timestamp":'
+_HEALTHY_BODY_SUFFIX = (
+    b',"environment":' + orjson.dumps(settings.normalized_env_mode) + b"}"
+)
 
-    - DB接続状況
-    - アプリケーションuptime
-    - 環境情報を返す
 
-    DB接続に失敗した場合は503 Service Unavailableを返す
+def _probe_database() -> DatabaseStatus:
     """
-    # uptime計算
-    start_time = getattr(request.app.state, "start_time", None)
-    uptime_seconds = 0.0
-    if start_time:
-        uptime_seconds = (datetime.now(UTC) - start_time).total_seconds()
+    DB接続をチェック
 
-    # DB接続チェック
+    Returns:
+        DB接続状況
+    """
     db_status = DatabaseStatus(status="healthy", connection=True, error=None)
-    overall_status: str = "ok"
 
     if settings.has_database:
-        try:
-            db_gen = get_db()
-            db: Session = next(db_gen)
+        if SessionLocal is None:
+            logger.error("Database connection failed: SessionLocal is not configured")
+            db_status.status = "unhealthy"
+            db_status.connection = False
+            db_status.error = "DB not configured"
+            return db_status
+
+        with SessionLocal() as db:
             try:
                 # 軽量なDB接続テスト
                 db.execute(text("SELECT 1"))
@@ -49,29 +59,115 @@ async def healthcheck(request: Request, response: Response) -> HealthCheckRespon
                 db_status.status = "unhealthy"
                 db_status.connection = False
                 db_status.error = str(e)
-                overall_status = "unhealthy"
-            finally:
-                try:
-                    next(db_gen)
-                except StopIteration:
-                    pass
-        except Exception as e:
-            logger.error(f"Database connection failed: {e}", exc_info=True)
-            db_status.status = "unhealthy"
-            db_status.connection = False
-            db_status.error = f"DB not configured: {e!s}"
-            overall_status = "unhealthy"
     else:
         db_status.status = "healthy"
         db_status.connection = False
         db_status.error = "Database disabled"
 
+    return db_status
+
+
+def _get_db_probe_lock(app: FastAPI) -> asyncio.Lock:
+    """
+    DB接続チェックの排他制御用ロックを取得
+
+    asyncio.Lockは最初に待ち合わせが発生したイベントループに紐づくため、
+    モジュール読み込み時ではなくアプリケーションごとに生成する
+    （lifespanの起動時に作り直される）。
+
+    Args:
+        app: FastAPIアプリケーションインスタンス
+
+    Returns:
+        ロック
+    """
+    lock: asyncio.Lock | None = getattr(app.state, "db_probe_lock", None)
+    if lock is None:
+        lock = app.state.db_probe_lock = asyncio.Lock()
+    return lock
+
+
+async def _get_database_status(app: FastAPI) -> tuple[DatabaseStatus, bytes]:
+    """
+    DB接続状況を取得（_DB_PROBE_TTL秒間は前回の結果を再利用）
+
+    Args:
+        app: FastAPIアプリケーションインスタンス
+
+    Returns:
+        (DB接続状況, DB接続状況をシリアライズしたJSON)
+    """
+    global _db_probe_cache
+
+    # キャッシュ切れの際に同時に届いたリクエストが一斉にDBへ問い合わせないよう、
+    # チェックは1つのリクエストのみが実行する
+    async with _get_db_probe_lock(app):
+        now = time.monotonic()
+        if _db_probe_cache is not None and now - _db_probe_cache[0] < _DB_PROBE_TTL:
+            return _db_probe_cache[1], _db_probe_cache[2]
+
+        # 同期的なDBアクセスでイベントループを止めないよう、スレッドプールで実行する
+        # （タイムアウト時はスレッドの完了を待たずに打ち切る）
+        try:
+            db_status = await asyncio.wait_for(
+                anyio.to_thread.run_sync(_probe_database, abandon_on_cancel=True),
+                timeout=_DB_PROBE_TIMEOUT,
+            )
+        except TimeoutError:
+            logger.error(
+                f"Database health check timed out after {_DB_PROBE_TIMEOUT} seconds"
+            )
+            db_status = DatabaseStatus(
+                status="unhealthy",
+                connection=False,
+                error="Database health check timed out",
+            )
+        db_status_json = db_status.model_dump_json().encode()
+        _db_probe_cache = (now, db_status, db_status_json)
+        return db_status, db_status_json
+
+
+@router.get("/", response_model=HealthCheckResponse)
+async def healthcheck(
+    request: Request, response: Response
+) -> HealthCheckResponse | Response:
+    """
+    ヘルスチェックエンドポイント
+
+    - DB接続状況（_DB_PROBE_TTL秒間は前回の結果を再利用）
+    - アプリケーションuptime
+    - 環境情報を返す
+
+    DB接続に失敗した場合は503 Service Unavailableを返す。
+    正常時はレスポンスモデルを経由せず、シリアライズ済みのJSONを組み立てて返す
+    """
+    # uptime計算（単調時計の差分を使用し、datetimeの生成を避ける）
+    start_monotonic = getattr(request.app.state, "start_monotonic", None)
+    uptime_seconds = 0.0
+    if start_monotonic is not None:
+        uptime_seconds = time.monotonic() - start_monotonic
+
+    # DB接続チェック
+    db_status, db_status_json = await _get_database_status(request.app)
+
+    if db_status.status != "unhealthy":
+        # timestampはpydanticと同じ形式（UTCは"Z"）でシリアライズする
+        return Response(
+            _HEALTHY_BODY_PREFIX
+            + orjson.dumps(datetime.now(UTC), option=orjson.OPT_UTC_Z)
+            + b',"uptime_seconds":'
+            + orjson.dumps(uptime_seconds)
+            + b',"database":'
+            + db_status_json
+            + _HEALTHY_BODY_SUFFIX,
+            media_type="application/json",
+        )
+
     # DB接続失敗時は503を返す
-    if overall_status == "unhealthy":
-        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
 
     return HealthCheckResponse(
-        status=overall_status,
+        status="unhealthy",
         timestamp=datetime.now(UTC),
         uptime_seconds=uptime_seconds,
         database=db_status,
@@ -2,5 +2,8 @@ from fastapi import APIRouter
 
 from . import root
 
-router = APIRouter()
-router.include_router(root.router, tags=["root"])
+# 登録するルーター（ルーター, プレフィックス, タグ）
+# api_routerへの登録はapp/presentation/api/__init__.pyでまとめて行う
+routers: list[tuple[APIRouter, str, list[str]]] = [
+    (root.router, "", ["root"]),
+]
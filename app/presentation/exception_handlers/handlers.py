@@ -1,17 +1,17 @@
 """FastAPI例外ハンドラー"""
 
-import json
 from collections.abc import Awaitable, Callable
-from typing import cast
+from typing import Any, cast
 
+import orjson
 from fastapi import FastAPI, Request, Response
-from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import (
     HTTPException as FastAPIHTTPException,
 )
 from fastapi.exceptions import (
     RequestValidationError,
 )
+from pydantic_core import to_jsonable_python
 
 from app.core import (
     APIError,
@@ -21,23 +21,87 @@ from app.core import (
     domain_error_to_api_error,
 )
 
+_JSON_CONTENT_TYPE = (b"content-type", b"application/json")
+
+
+class JSONBytesResponse(Response):
+    """
+    シリアライズ済みのJSONボディを返すレスポンス
+
+    Responseのコンストラクタによるボディのエンコードやmedia_typeからの
+    ヘッダー組み立てを行わず、事前に用意したヘッダーを直接設定する。
+    """
+
+    media_type = "application/json"
+
+    def __init__(self, content: bytes, status_code: int) -> None:
+        """
+        Args:
+            content: JSONボディ（UTF-8のバイト列）
+            status_code: HTTPステータスコード
+        """
+        self.status_code = status_code
+        self.background = None
+        self.body = content
+        self.raw_headers = [
+            (b"content-length", str(len(content)).encode("latin-1")),
+            _JSON_CONTENT_TYPE,
+        ]
+
+
+def _error_response(
+    code: str,
+    message: str,
+    details: list[dict[str, Any]] | dict[str, Any] | None,
+    status_code: int,
+) -> Response:
+    """
+    エラー情報をErrorResponse形式のJSONレスポンスに変換
+
+    ErrorResponseモデルの生成（detailsのバリデーション）を行わず、orjsonで直接JSON化する。
+    orjsonが扱えない値はPydanticと同じ規則（to_jsonable_python）で変換するため、
+    出力はErrorResponse.model_dump_json()と同一になる。
+
+    Args:
+        code: エラーコード
+        message: エラーメッセージ
+        details: エラーの詳細情報
+        status_code: HTTPステータスコード
+
+    Returns:
+        JSONレスポンス
+    """
+    try:
+        body = orjson.dumps(
+            {"status": "error", "code": code, "message": message, "details": details},
+            default=to_jsonable_python,
+            option=orjson.OPT_UTC_Z,
+        )
+    except orjson.JSONEncodeError:
+        # 64bitを超える整数等、orjsonで扱えない値はPydanticのシリアライザで処理する
+        body = (
+            ErrorResponse(code=code, message=message, details=details)
+            .model_dump_json()
+            .encode()
+        )
+    return JSONBytesResponse(body, status_code)
+
 
 async def domain_error_handler(request: Request, exc: DomainError) -> Response:
     """DomainError例外ハンドラ"""
     api_error = domain_error_to_api_error(exc)
-    return Response(
-        content=json.dumps(jsonable_encoder(api_error.to_response())),
-        status_code=api_error.status_code,
-        media_type="application/json",
+    return _error_response(
+        api_error.error_code,
+        api_error.error_message,
+        api_error.details,
+        api_error.status_code,
     )
 
 
 async def api_error_handler(request: Request, exc: APIError) -> Response:
     """APIError例外ハンドラ（後方互換性のため保持）"""
-    return Response(
-        content=json.dumps(jsonable_encoder(exc.to_response())),
-        status_code=exc.status_code,
-        media_type="application/json",
+    return _error_response(
+        exc.error_code, exc.error_message, exc.details, exc.status_code
     )
 
 
@@ -45,34 +109,35 @@ async def http_exception_handler(
     request: Request, exc: FastAPIHTTPException
 ) -> Response:
     """HTTPException例外ハンドラ"""
-    error = ErrorResponse(
-        code="http_error",
-        message=str(exc.detail),
-    )
-    return Response(
-        content=json.dumps(jsonable_encoder(error)),
-        status_code=exc.status_code,
-        media_type="application/json",
-    )
+    return _error_response("http_error", str(exc.detail), None, exc.status_code)
+
+
+# リクエストバリデーションエラーのステータスコード・エラーコード・メッセージは固定のため、
+# ドメインエラーからの変換結果をモジュール読み込み時に確定する
+_REQUEST_VALIDATION_ERROR = domain_error_to_api_error(
+    ValidationError(message="Invalid request body")
+)
 
 
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
 ) -> Response:
-    """バリデーションエラーハンドラ（Pydantic）"""
-    error = ValidationError(
-        message="Invalid request body",
-        details=[
+    """
+    バリデーションエラーハンドラ（Pydantic）
+
+    エラー件数に比例するdetailsの変換コストを抑えるため、ErrorResponseモデルを
+    経由せずorjsonで直接JSON化する（出力はErrorResponseと同一の形式）。
+    """
+    body = orjson.dumps({
+        "status": "error",
+        "code": _REQUEST_VALIDATION_ERROR.error_code,
+        "message": _REQUEST_VALIDATION_ERROR.error_message,
+        "details": [
             {"loc": err["loc"], "msg": err["msg"], "type": err["type"]}
             for err in exc.errors()
         ],
-    )
-    api_error = domain_error_to_api_error(error)
-    return Response(
-        content=json.dumps(jsonable_encoder(api_error.to_response())),
-        status_code=api_error.status_code,
-        media_type="application/json",
-    )
+    })
+    return JSONBytesResponse(body, _REQUEST_VALIDATION_ERROR.status_code)
 
 
 def register_exception_handlers(app: FastAPI) -> None:
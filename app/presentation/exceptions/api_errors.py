@@ -83,6 +83,17 @@ class APIError(HTTPException):
         )
 
 
+# エラータイプに応じたHTTPステータスコードのマッピング
+# （変換のたびに生成しないよう、モジュール読み込み時に構築する）
+_DOMAIN_ERROR_STATUS_CODES: dict[type[DomainError], int] = {
+    NotFoundError: status.HTTP_404_NOT_FOUND,
+    BadRequestError: status.HTTP_400_BAD_REQUEST,
+    UnauthorizedError: status.HTTP_401_UNAUTHORIZED,
+    ForbiddenError: status.HTTP_403_FORBIDDEN,
+    ValidationError: status.HTTP_400_BAD_REQUEST,
+}
+
+
 def domain_error_to_api_error(domain_error: DomainError) -> APIError:
     """
     ドメインエラーをAPIエラーに変換
@@ -103,17 +114,8 @@ def domain_error_to_api_error(domain_error: DomainError) -> APIError:
         >>> api_err.status_code
         404
     """
-    # エラータイプに応じたHTTPステータスコードのマッピング
-    status_map: dict[type, int] = {
-        NotFoundError: status.HTTP_404_NOT_FOUND,
-        BadRequestError: status.HTTP_400_BAD_REQUEST,
-        UnauthorizedError: status.HTTP_401_UNAUTHORIZED,
-        ForbiddenError: status.HTTP_403_FORBIDDEN,
-        ValidationError: status.HTTP_400_BAD_REQUEST,
-    }
-
     # ステータスコードを決定
-    status_code = status_map.get(
+    status_code = _DOMAIN_ERROR_STATUS_CODES.get(
         type(domain_error), status.HTTP_500_INTERNAL_SERVER_ERROR
     )
 
@@ -1,43 +1,117 @@
 """エラーハンドリングミドルウェア"""
 
-import json
-from collections.abc import Awaitable, Callable
+import asyncio
+import contextvars
 
 import sentry_sdk
-from fastapi import Request, Response
-from fastapi.encoders import jsonable_encoder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core import ErrorResponse
 from app.core.logging import get_logger
+from app.presentation.exception_handlers.handlers import JSONBytesResponse
 
 logger = get_logger(__name__)
 
+# 未処理例外時のレスポンスボディは常に同一のため、モジュール読み込み時に一度だけJSON化する
+_INTERNAL_SERVER_ERROR_BODY = (
+    ErrorResponse(
+        code="internal_server_error",
+        message="Internal server error occurred",
+    )
+    .model_dump_json()
+    .encode()
+)
 
-async def error_response_middleware(
-    request: Request, call_next: Callable[[Request], Awaitable[Response]]
-) -> Response:
+
+def _report_exception(exc: Exception) -> None:
+    """
+    未処理例外をSentryへ送信し、ログに出力
+
+    Args:
+        exc: 発生した例外
     """
-    全ての未処理例外をキャッチしてJSON形式で返す
+    sentry_sdk.capture_exception(exc)
+    # SentryのLoggingIntegrationによる重複送信は、同一コンテキスト内で
+    # 先にcapture_exceptionしていることで抑止される
+    logger.error(f"Unhandled exception: {exc!s}", exc_info=exc)
+
+
+def _log_report_failure(future: "asyncio.Future[None]") -> None:
+    """
+    例外の報告処理で発生した例外をログに出力
 
     Args:
-        request: HTTPリクエスト
-        call_next: 次のミドルウェア/エンドポイント
-
-    Returns:
-        HTTPレスポンス
-    """
-    try:
-        return await call_next(request)
-    except Exception as e:
-        sentry_sdk.capture_exception(e)
-        logger.error(f"Unhandled exception: {e!s}", exc_info=e)
-
-        error = ErrorResponse(
-            code="internal_server_error",
-            message="Internal server error occurred",
-        )
-        return Response(
-            content=json.dumps(jsonable_encoder(error)),
-            status_code=500,
-            media_type="application/json",
-        )
+        future: _report_exceptionの実行結果
+    """
+    if exc := future.exception():
+        logger.warning(f"Failed to report unhandled exception: {exc!s}")
+
+
+def _report_exception_in_background(exc: Exception) -> None:
+    """
+    未処理例外の報告をスレッドプールで実行
+
+    Sentryイベントのシリアライズをイベントループ上で行わないようにする。
+    Sentryのスコープ（リクエスト情報等）を引き継ぐため、現在のコンテキストで実行する。
+
+    Args:
+        exc: 発生した例外
+    """
+    context = contextvars.copy_context()
+    future = asyncio.get_running_loop().run_in_executor(
+        None, context.run, _report_exception, exc
+    )
+    future.add_done_callback(_log_report_failure)
+
+
+class ErrorResponseMiddleware:
+    """
+    全ての未処理例外をキャッチしてJSON形式で返すミドルウェア
+
+    BaseHTTPMiddlewareを使わないASGIミドルウェアとして実装し、
+    リクエストごとのRequest/Responseオブジェクトやタスクの生成を避ける。
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Args:
+            app: 次のASGIアプリケーション
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        後続のアプリケーションを呼び出し、未処理例外を500レスポンスに変換する
+
+        Args:
+            scope: ASGIスコープ
+            receive: ASGI receiveチャネル
+            send: ASGI sendチャネル
+
+        Raises:
+            Exception: レスポンスの送信開始後に例外が発生した場合
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            _report_exception_in_background(e)
+
+            # レスポンスの送信開始後はステータスコードを変更できない
+            if response_started:
+                raise
+
+            await JSONBytesResponse(_INTERNAL_SERVER_ERROR_BODY, 500)(
+                scope, receive, send
+            )
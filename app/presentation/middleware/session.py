@@ -1,68 +1,205 @@
 """セッション管理ミドルウェア"""
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Collection
+from typing import Any
 
-from fastapi import Request, Response
+from sqlalchemy.orm import Session as DBSession
+from sqlalchemy.orm import sessionmaker
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.core.config import get_settings
-from app.infrastructure.database import get_db
+from app.infrastructure.database import SessionLocal
 from app.infrastructure.repositories.session_repository import SessionService
+from app.infrastructure.security.encryption import generate_fingerprint
 
 settings = get_settings()
 
+# 設定値はプロセス内で不変のため、リクエストごとに評価せずモジュール読み込み時に確定する
+_HAS_DATABASE = settings.has_database
+_SESSION_COOKIE_PREFIX = f"{settings.SESSION_COOKIE_NAME}=".encode("latin-1")
 
-async def session_middleware(
-    request: Request, call_next: Callable[[Request], Awaitable[Response]]
-) -> Response:
+# セッションを使用しないパス（ヘルスチェック・静的ファイル）
+# 前方一致は"/"の境界までを含めて判定し、"/staticfoo"等の別ルートを巻き込まない
+_SESSION_SKIP_PATHS = frozenset({"/api/system/healthcheck"})
+_SESSION_SKIP_PREFIXES = (
+    "/api/system/healthcheck/",
+    "/static/",
+)
+
+# クライアントIPを示すヘッダー（ASGIのヘッダー名は小文字のバイト列）
+_CF_CONNECTING_IP = b"cf-connecting-ip"
+_X_FORWARDED_FOR = b"x-forwarded-for"
+_USER_AGENT = b"user-agent"
+_COOKIE = b"cookie"
+
+
+def _get_session_id(scope: Scope) -> str | None:
     """
-    セッション管理ミドルウェア
+    CookieヘッダーからセッションIDを取得
 
-    DATABASE_URLが設定されている場合のみ、RDBベースのセッション管理を有効化
+    request.cookiesはCookieヘッダー全体を辞書に変換するため、
+    ASGIスコープの生のヘッダーからセッションCookieのみを直接取り出す。
 
     Args:
-        request: HTTPリクエスト
-        call_next: 次のミドルウェア/エンドポイント
+        scope: ASGIスコープ
 
     Returns:
-        HTTPレスポンス
+        セッションID（存在しない場合はNone）
     """
-    if settings.has_database:
-        db_gen = get_db()
-        db = next(db_gen)
-        try:
-            session_id = request.cookies.get(settings.SESSION_COOKIE_NAME)
-            if session_id:
-                service = SessionService(db)
-                user_agent = request.headers.get("User-Agent")
-                client_ip_headers = ["CF-Connecting-IP", "X-Forwarded-For"]
-                client_ip = None
-                for header in client_ip_headers:
-                    client_ip = request.headers.get(header)
-                    if client_ip:
-                        break
-                if not client_ip:
-                    client_ip = request.client.host if request.client else None
-
-                session_data = service.get_session(session_id, user_agent, client_ip)
-
-                request.state.session = session_data or {}
-                request.state.session_id = session_id
-                request.state.client_ip = client_ip
-                request.state.user_agent = user_agent
-            else:
-                request.state.session = {}
-
-            response = await call_next(request)
-
-            # セッションデータの永続化は各エンドポイントで明示的に実施
-            # ミドルウェアでの自動保存は行わない（パフォーマンス対策）
-
-            return response
-        finally:
-            try:
-                next(db_gen)
-            except StopIteration:
-                pass
-    else:
-        request.state.session = None
-        return await call_next(request)
+    cookie_header = next(
+        (value for name, value in scope["headers"] if name == _COOKIE), None
+    )
+    if not cookie_header:
+        return None
+
+    session_id: bytes | None = None
+    for chunk in cookie_header.split(b";"):
+        chunk = chunk.strip()
+        # 同名のCookieが複数ある場合は最後のものを使用（request.cookiesと同じ）
+        if chunk.startswith(_SESSION_COOKIE_PREFIX):
+            session_id = chunk[len(_SESSION_COOKIE_PREFIX) :]
+    return session_id.decode("latin-1") if session_id else None
+
+
+def _get_client_info(scope: Scope) -> tuple[str | None, str | None]:
+    """
+    User-AgentとクライアントIPをヘッダーの1回の走査で取得
+
+    ヘッダー名ごとにrequest.headers.get()で線形探索する代わりに、
+    ASGIスコープの生のヘッダーを1度だけ走査する。
+
+    クライアントIPの優先順位: CF-Connecting-IP > X-Forwarded-For（先頭のIP）> client.host
+
+    Args:
+        scope: ASGIスコープ
+
+    Returns:
+        (User-Agent, クライアントIP)
+    """
+    user_agent: bytes | None = None
+    cf_connecting_ip: bytes | None = None
+    forwarded_for: bytes | None = None
+    for name, value in scope["headers"]:
+        # 同名のヘッダーが複数ある場合は最初のものを使用（request.headers.get()と同じ）
+        if name == _USER_AGENT:
+            user_agent = user_agent or value
+        elif name == _CF_CONNECTING_IP:
+            cf_connecting_ip = cf_connecting_ip or value
+        elif name == _X_FORWARDED_FOR:
+            forwarded_for = forwarded_for or value
+
+    client_ip: str | None = None
+    if cf_connecting_ip:
+        client_ip = cf_connecting_ip.decode("latin-1")
+    elif forwarded_for:
+        # X-Forwarded-Forには複数のIPが含まれる可能性があるため、最初のものを使用
+        # （split()によるリストの生成を避け、最初のカンマまでをスライスする）
+        comma = forwarded_for.find(b",")
+        if comma >= 0:
+            forwarded_for = forwarded_for[:comma]
+        client_ip = forwarded_for.strip().decode("latin-1")
+    if not client_ip:
+        client = scope.get("client")
+        client_ip = client[0] if client else None
+
+    return (user_agent.decode("latin-1") if user_agent else None), client_ip
+
+
+def _load_session(
+    session_factory: sessionmaker[DBSession],
+    session_id: str,
+    user_agent: str | None,
+    client_ip: str | None,
+    fingerprint: str,
+) -> dict[str, Any] | None:
+    """
+    DBからセッションを読み込む（同期処理のためスレッドプールで実行する）
+
+    Args:
+        session_factory: DBセッションのファクトリ
+        session_id: セッションID
+        user_agent: User-Agentヘッダー
+        client_ip: クライアントIPアドレス
+        fingerprint: 計算済みのフィンガープリント
+
+    Returns:
+        セッションデータ、存在しないまたは無効な場合はNone
+    """
+    # DB接続はセッションの読み込み中のみ保持し、後続の処理の前にプールへ返す
+    with session_factory() as db:
+        return SessionService(db).get_session(
+            session_id, user_agent, client_ip, fingerprint=fingerprint
+        )
+
+
+class SessionMiddleware:
+    """
+    セッション管理ミドルウェア
+
+    DATABASE_URLが設定されている場合のみ、RDBベースのセッション管理を有効化。
+    BaseHTTPMiddlewareを使わないASGIミドルウェアとして実装し、
+    リクエストごとのRequest/Responseオブジェクトやタスクの生成を避ける。
+    セッション情報はscope["state"]に格納し、request.stateとして参照できる。
+    ヘルスチェック・静的ファイル・skip_pathsに完全一致するパスではセッションを読み込まない。
+    """
+
+    def __init__(self, app: ASGIApp, skip_paths: Collection[str] = ()) -> None:
+        """
+        Args:
+            app: 次のASGIアプリケーション
+            skip_paths: セッションを読み込まないパス（完全一致、APIドキュメント等）
+        """
+        self.app = app
+        self.skip_paths = _SESSION_SKIP_PATHS | frozenset(skip_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        リクエストのセッションを読み込み、後続のアプリケーションを呼び出す
+
+        Args:
+            scope: ASGIスコープ
+            receive: ASGI receiveチャネル
+            send: ASGI sendチャネル
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+
+        if (
+            not _HAS_DATABASE
+            or SessionLocal is None
+            or scope["path"] in self.skip_paths
+            or scope["path"].startswith(_SESSION_SKIP_PREFIXES)
+        ):
+            state["session"] = None
+            await self.app(scope, receive, send)
+            return
+
+        session_id = _get_session_id(scope)
+        if not session_id:
+            # セッションCookieがないリクエストではDB接続を取得しない
+            state["session"] = {}
+            await self.app(scope, receive, send)
+            return
+
+        user_agent, client_ip = _get_client_info(scope)
+        # フィンガープリントはリクエストごとに1回だけ生成し、後続の処理でも再利用する
+        fingerprint = generate_fingerprint(user_agent, client_ip)
+
+        # 同期的なDBアクセスでイベントループを止めないよう、スレッドプールで実行する
+        session_data = await run_in_threadpool(
+            _load_session, SessionLocal, session_id, user_agent, client_ip, fingerprint
+        )
+
+        state["session"] = session_data or {}
+        state["session_id"] = session_id
+        state["client_ip"] = client_ip
+        state["user_agent"] = user_agent
+        state["fingerprint"] = fingerprint
+
+        # セッションデータの永続化は各エンドポイントで明示的に実施
+        # ミドルウェアでの自動保存は行わない（パフォーマンス対策）
+        await self.app(scope, receive, send)
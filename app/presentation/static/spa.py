@@ -1,27 +1,105 @@
 """SPA対応の静的ファイルサーバー"""
 
+import stat
 from collections.abc import MutableMapping
+from pathlib import Path
 from typing import Any
 
+import anyio.to_thread
 from fastapi import Response
-from fastapi.exceptions import HTTPException as FastAPIHTTPException
+from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.staticfiles import NotModifiedResponse
+
+# キャッシュしたindex.html: ((更新日時, サイズ), ボディ, レスポンスヘッダー)
+_IndexCache = tuple[tuple[float, int], bytes, dict[str, str]]
 
 
 class SPAStaticFiles(StaticFiles):
     """
     SPA対応の静的ファイルサーバー
 
-    404エラーが発生した場合にindex.htmlを返すことで、
+    存在しないパスへのリクエストにindex.htmlを返すことで、
     React Routerのhistory modeをサポート
+
+    index.htmlの内容はワーカーごとにメモリ上へキャッシュし、ファイルの
+    更新日時・サイズが変わらない間は読み直さない（フロントエンドの再デプロイ時は
+    1回のstatで変更を検知して読み直す）。
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._index_cache: _IndexCache | None = None
+
+    async def _get_index_response(self, scope: MutableMapping[str, Any]) -> Response:
+        """
+        キャッシュしたindex.htmlからレスポンスを生成
+
+        ミドルウェアがレスポンスヘッダーを書き換えるため、
+        Responseオブジェクトは共有せずにボディとヘッダーのみをキャッシュする。
+        ETag・Last-ModifiedはFileResponseと同じ値を付与し、条件付きリクエストには
+        StaticFilesと同様に304を返す。
+
+        Args:
+            scope: ASGIスコープ
+
+        Returns:
+            index.htmlのレスポンス
+        """
+        full_path, stat_result = await anyio.to_thread.run_sync(
+            self.lookup_path, "index.html"
+        )
+        if stat_result is None:
+            raise StarletteHTTPException(status_code=404)
+
+        cache_key = (stat_result.st_mtime, stat_result.st_size)
+        if self._index_cache is None or self._index_cache[0] != cache_key:
+            body = await anyio.to_thread.run_sync(Path(full_path).read_bytes)
+            # ヘッダーの生成はFileResponseに任せる（ファイルは開かない）
+            headers = dict(FileResponse(full_path, stat_result=stat_result).headers)
+            # statと読み込みの間にファイルが置き換えられても食い違わないよう、
+            # Content-Lengthは読み込んだボディから算出させる
+            headers.pop("content-length", None)
+            self._index_cache = (cache_key, body, headers)
+
+        _, body, headers = self._index_cache
+        if self.is_not_modified(Headers(headers=headers), Headers(scope=scope)):
+            return NotModifiedResponse(Headers(headers=headers))
+        return Response(body, headers=headers)
+
     async def get_response(
         self, path: str, scope: MutableMapping[str, Any]
     ) -> Response:
+        # SPAのルートはほとんどが存在しないパスのため、StaticFilesに404例外を
+        # 送出させる前にパスを確認し、例外を経由せずにindex.htmlを返す
+        if scope["method"] in ("GET", "HEAD"):
+            try:
+                full_path, stat_result = await anyio.to_thread.run_sync(
+                    self.lookup_path, path
+                )
+            except OSError:
+                # パーミッションエラー等の扱いはStaticFilesに任せる
+                pass
+            else:
+                if stat_result is None:
+                    if self.html:
+                        # StaticFilesと同様に404.htmlがあればそれを返す
+                        full_path, stat_result = await anyio.to_thread.run_sync(
+                            self.lookup_path, "404.html"
+                        )
+                        if stat_result and stat.S_ISREG(stat_result.st_mode):
+                            return FileResponse(
+                                full_path, stat_result=stat_result, status_code=404
+                            )
+                    return await self._get_index_response(scope)
+                if stat.S_ISREG(stat_result.st_mode):
+                    return self.file_response(full_path, stat_result, scope)
+
         try:
             return await super().get_response(path, scope)
-        except FastAPIHTTPException as ex:
+        except StarletteHTTPException as ex:
             if ex.status_code == 404:
-                return await super().get_response("index.html", scope)
+                return await self._get_index_response(scope)
             raise ex
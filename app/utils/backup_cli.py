@@ -1,6 +1,10 @@
 """バックアップ管理CLI"""
 
+import os
+import shutil
+import tempfile
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 import click
@@ -8,26 +12,80 @@ import opendal
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.infrastructure.database.backup.core import is_backup_file
 
 logger = get_logger(__name__)
 
+# S3からのダウンロード時に一度に読み込むサイズ（バイト）
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
-def get_local_backups() -> list[Path]:
+
+@lru_cache(maxsize=1)
+def get_s3_operator() -> opendal.Operator:
+    """
+    S3ストレージのOperatorを取得する（キャッシュ）。
+
+    各コマンドで認証情報の解析やクライアントの初期化を繰り返さないよう、
+    同一プロセス内では1つのインスタンスを使い回す。
+    S3設定の有無は呼び出し側で確認すること。
+
+    Returns:
+        S3ストレージのOperator
+    """
+    settings = get_settings()
+    return opendal.Operator(
+        "s3",
+        endpoint=settings.S3_ENDPOINT,
+        bucket=settings.S3_BUCKET,
+        access_key_id=settings.S3_ACCESS_KEY,
+        secret_access_key=settings.S3_SECRET_KEY,
+        region=settings.S3_REGION or "us-east-1",
+    )
+
+
+def download_s3_backup(backup_file: str) -> Path:
+    """
+    S3のバックアップファイルを一時ディレクトリにダウンロードする。
+
+    バックアップ全体をメモリに読み込まないよう、チャンク単位でディスクに書き出す。
+
+    Args:
+        backup_file: S3上のバックアップファイル名
+
+    Returns:
+        ダウンロードしたファイルのパス
+    """
+    temp_dir = Path(tempfile.mkdtemp())
+    restore_path = temp_dir / backup_file
+    try:
+        with (
+            get_s3_operator().open(backup_file, "rb") as src,
+            restore_path.open("wb") as dst,
+        ):
+            shutil.copyfileobj(src, dst, _DOWNLOAD_CHUNK_SIZE)
+    except Exception:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
+    return restore_path
+
+
+def get_local_backups() -> list[os.DirEntry[str]]:
     """
     ローカルバックアップファイルのリストを取得する。
 
+    DirEntryはディレクトリ走査時に取得したstat情報をキャッシュするため、
+    並び替えや一覧表示でファイルごとにstatを繰り返さない。
+
     Returns:
-        バックアップファイルのパスリスト（日付降順）
+        バックアップファイルのエントリリスト（日付降順）
     """
-    local_backup_dir = Path("./backups")
-    if not local_backup_dir.exists():
+    try:
+        with os.scandir("./backups") as entries:
+            backups = [entry for entry in entries if is_backup_file(entry.name)]
+    except FileNotFoundError:
         return []
 
-    backups = sorted(
-        local_backup_dir.glob("backup_*.backup.gz"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
+    backups.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
     return backups
 
 
@@ -44,22 +102,9 @@ def get_s3_backups() -> list[str]:
         return []
 
     try:
-        storage = opendal.Operator(
-            "s3",
-            endpoint=settings.S3_ENDPOINT,
-            bucket=settings.S3_BUCKET,
-            access_key_id=settings.S3_ACCESS_KEY,
-            secret_access_key=settings.S3_SECRET_KEY,
-            region=settings.S3_REGION or "us-east-1",
-        )
-
         # OpenDALのlist機能を使用してバックアップファイルを列挙
-        entries = storage.list("")
-        backups = [
-            entry.path
-            for entry in entries
-            if entry.path.startswith("backup_") and entry.path.endswith(".backup.gz")
-        ]
+        entries = get_s3_operator().list("")
+        backups = [entry.path for entry in entries if is_backup_file(entry.path)]
         return sorted(backups, reverse=True)
     except Exception as e:
         logger.error(f"Failed to list S3 backups: {e}")
@@ -99,8 +144,9 @@ def backup_list(remote: bool) -> None:
     if local_backups:
         click.echo("Local backups:")
         for backup in local_backups:
-            size_mb = backup.stat().st_size / (1024 * 1024)
-            mtime = datetime.fromtimestamp(backup.stat().st_mtime)
+            stat_result = backup.stat()
+            size_mb = stat_result.st_size / (1024 * 1024)
+            mtime = datetime.fromtimestamp(stat_result.st_mtime)
             click.echo(f"  - {backup.name} ({size_mb:.2f} MB, {mtime})")
     else:
         click.echo("No local backups found")
@@ -123,7 +169,12 @@ def backup_list(remote: bool) -> None:
     is_flag=True,
     help="S3からバックアップを取得",
 )
-def backup_diff(backup_file: str, from_s3: bool) -> None:
+@click.option(
+    "--estimate",
+    is_flag=True,
+    help="COUNT(*)の代わりに統計情報による推定行数を使用（高速・近似値）",
+)
+def backup_diff(backup_file: str, from_s3: bool, estimate: bool) -> None:
     """
     バックアップと現在のデータベースの差分を表示する。
 
@@ -146,23 +197,7 @@ def backup_diff(backup_file: str, from_s3: bool) -> None:
 
             click.echo(f"Downloading from S3: {backup_file}")
 
-            storage = opendal.Operator(
-                "s3",
-                endpoint=settings.S3_ENDPOINT,
-                bucket=settings.S3_BUCKET,
-                access_key_id=settings.S3_ACCESS_KEY,
-                secret_access_key=settings.S3_SECRET_KEY,
-                region=settings.S3_REGION or "us-east-1",
-            )
-
-            data = storage.read(backup_file)
-
-            # 一時ファイルに保存
-            import tempfile
-
-            temp_dir = Path(tempfile.mkdtemp())
-            restore_path = temp_dir / backup_file
-            restore_path.write_bytes(data)
+            restore_path = download_s3_backup(backup_file)
         else:
             # ローカルファイル
             restore_path = Path("./backups") / backup_file
@@ -172,7 +207,7 @@ def backup_diff(backup_file: str, from_s3: bool) -> None:
 
         # Diffを計算
         click.echo(f"Calculating diff for: {backup_file}")
-        diff_summary = calculate_diff(restore_path)
+        diff_summary = calculate_diff(restore_path, exact=not estimate)
 
         click.echo("\nBackup diff summary:")
         for table_name, table_diff in diff_summary.tables.items():
@@ -192,8 +227,6 @@ def backup_diff(backup_file: str, from_s3: bool) -> None:
     finally:
         # S3からダウンロードした場合、一時ファイルを削除
         if from_s3 and restore_path and restore_path.parent.name.startswith("tmp"):
-            import shutil
-
             shutil.rmtree(restore_path.parent, ignore_errors=True)
 
 
@@ -238,23 +271,7 @@ def backup_restore(backup_file: str, from_s3: bool, yes: bool, dry_run: bool) ->
 
             click.echo(f"Downloading from S3: {backup_file}")
 
-            storage = opendal.Operator(
-                "s3",
-                endpoint=settings.S3_ENDPOINT,
-                bucket=settings.S3_BUCKET,
-                access_key_id=settings.S3_ACCESS_KEY,
-                secret_access_key=settings.S3_SECRET_KEY,
-                region=settings.S3_REGION or "us-east-1",
-            )
-
-            data = storage.read(backup_file)
-
-            # 一時ファイルに保存
-            import tempfile
-
-            temp_dir = Path(tempfile.mkdtemp())
-            restore_path = temp_dir / backup_file
-            restore_path.write_bytes(data)
+            restore_path = download_s3_backup(backup_file)
             click.echo(f"Downloaded to: {restore_path}")
         else:
             # ローカルファイル
@@ -321,8 +338,6 @@ def backup_restore(backup_file: str, from_s3: bool, yes: bool, dry_run: bool) ->
     finally:
         # S3からダウンロードした場合、一時ファイルを削除
         if from_s3 and restore_path and restore_path.parent.name.startswith("tmp"):
-            import shutil
-
             shutil.rmtree(restore_path.parent, ignore_errors=True)
 
 
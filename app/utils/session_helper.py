@@ -32,6 +32,19 @@ def get_client_ip(request: Request) -> str | None:
     return request.client.host if request.client else None
 
 
+def get_fingerprint(request: Request) -> str | None:
+    """
+    セッションミドルウェアで生成済みのフィンガープリントを取得
+
+    Args:
+        request: FastAPI Request
+
+    Returns:
+        フィンガープリント、未生成の場合はNone
+    """
+    return getattr(request.state, "fingerprint", None)
+
+
 def get_user_agent(request: Request) -> str | None:
     """
     User-Agentヘッダーを取得
@@ -68,7 +81,9 @@ def create_session(
     user_agent = get_user_agent(request)
     client_ip = get_client_ip(request)
 
-    session_id, csrf_token = service.create_session(data, user_agent, client_ip)
+    session_id, csrf_token = service.create_session(
+        data, user_agent, client_ip, fingerprint=get_fingerprint(request)
+    )
 
     response.set_cookie(
         key=settings.SESSION_COOKIE_NAME,
@@ -109,7 +124,12 @@ def get_session_data(
     client_ip = get_client_ip(request)
 
     return service.get_session(
-        session_id, user_agent, client_ip, verify_csrf, csrf_token
+        session_id,
+        user_agent,
+        client_ip,
+        verify_csrf,
+        csrf_token,
+        fingerprint=get_fingerprint(request),
     )
 
 
@@ -138,7 +158,9 @@ def update_session_data(
     user_agent = get_user_agent(request)
     client_ip = get_client_ip(request)
 
-    return service.update_session(session_id, data, user_agent, client_ip)
+    return service.update_session(
+        session_id, data, user_agent, client_ip, fingerprint=get_fingerprint(request)
+    )
 
 
 def delete_session(
@@ -195,7 +217,9 @@ def regenerate_session_id(
     user_agent = get_user_agent(request)
     client_ip = get_client_ip(request)
 
-    result = service.regenerate_session_id(old_session_id, user_agent, client_ip)
+    result = service.regenerate_session_id(
+        old_session_id, user_agent, client_ip, fingerprint=get_fingerprint(request)
+    )
     if not result:
         return None
 
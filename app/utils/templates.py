@@ -1,8 +1,13 @@
+from typing import TYPE_CHECKING
+
 from fastapi import Request
-from fastapi.templating import Jinja2Templates
+
+if TYPE_CHECKING:
+    # 型チェック時のみimportする（jinja2の読み込みはテンプレートが有効な場合に限る）
+    from fastapi.templating import Jinja2Templates
 
 
-def get_templates(request: Request) -> Jinja2Templates | None:
+def get_templates(request: Request) -> "Jinja2Templates | None":
     """
     リクエストからJinja2Templatesインスタンスを取得
 
@@ -34,21 +34,21 @@ def sample_session_data(
         sessions = [
             SessionModel(
                 session_id="test_session_1",
-                data="encrypted_data_1",
+                data=b"encrypted_data_1",
                 expires_at=datetime.now(UTC),
                 fingerprint="fingerprint_1",
                 csrf_token="csrf_token_1",
             ),
             SessionModel(
                 session_id="test_session_2",
-                data="encrypted_data_2",
+                data=b"encrypted_data_2",
                 expires_at=datetime.now(UTC),
                 fingerprint="fingerprint_2",
                 csrf_token="csrf_token_2",
             ),
             SessionModel(
                 session_id="test_session_3",
-                data="encrypted_data_3",
+                data=b"encrypted_data_3",
                 expires_at=datetime.now(UTC),
                 fingerprint="fingerprint_3",
                 csrf_token="csrf_token_3",
@@ -1,10 +1,10 @@
 """バックアップコア機能の単体テスト"""
 
-import gzip
 import json
 from pathlib import Path
 
 import pytest
+import zstandard
 from sqlalchemy.orm import Session
 
 from app.infrastructure.database.backup.core import create_backup
@@ -29,7 +29,7 @@ class TestCreateBackup:
 
         # ファイルが作成されていること
         assert backup_file.exists()
-        assert backup_file.suffix == ".gz"
+        assert backup_file.name.endswith(".backup.zst")
         assert backup_file.name.startswith("backup_")
 
         # ファイルサイズが0より大きいこと
@@ -76,14 +76,14 @@ class TestCreateBackup:
         backup_file = create_backup(output_dir=output_dir)
 
         # ファイルを読み込んで解凍
-        with gzip.open(backup_file, "rb") as f:
+        with zstandard.open(backup_file, "rb") as f:
             json_data = f.read().decode("utf-8")
 
         # JSONをパース
         backup_data = BackupData.model_validate_json(json_data)
 
         # メタデータの検証
-        assert backup_data.metadata.version == "1.0"
+        assert backup_data.metadata.version == "1.1"
         assert isinstance(backup_data.metadata.timestamp, object)
         assert isinstance(backup_data.metadata.migration_version, str)
         assert len(backup_data.metadata.migration_version) > 0
@@ -108,15 +108,15 @@ class TestCreateBackup:
         sample_session_data: list[SessionModel],
         tmp_path: Path,
     ) -> None:
-        """バックアップファイルがgzip圧縮されていること"""
+        """バックアップファイルがzstd圧縮されていること"""
         output_dir = tmp_path / "backups"
 
         # バックアップ作成
         backup_file = create_backup(output_dir=output_dir)
 
-        # gzipファイルとして読み込めること
+        # zstdファイルとして読み込めること
         try:
-            with gzip.open(backup_file, "rb") as f:
+            with zstandard.open(backup_file, "rb") as f:
                 content = f.read()
                 # JSON形式としてパースできること
                 json.loads(content.decode("utf-8"))
@@ -159,3 +159,21 @@ class TestCreateBackup:
         assert backup_file_1 != backup_file_2
         assert backup_file_1.exists()
         assert backup_file_2.exists()
+
+    def test_create_backup_sequential_matches_parallel(
+        self,
+        db_session: Session,
+        sample_session_data: list[SessionModel],
+        tmp_path: Path,
+    ) -> None:
+        """逐次処理と並列処理で同じテーブルデータが書き出されること"""
+        sequential_file = create_backup(output_dir=tmp_path / "seq", max_workers=1)
+        parallel_file = create_backup(output_dir=tmp_path / "par", max_workers=4)
+
+        with zstandard.open(sequential_file, "rb") as f:
+            sequential = BackupData.model_validate_json(f.read())
+        with zstandard.open(parallel_file, "rb") as f:
+            parallel = BackupData.model_validate_json(f.read())
+
+        assert list(sequential.tables) == list(parallel.tables)
+        assert sequential.tables == parallel.tables
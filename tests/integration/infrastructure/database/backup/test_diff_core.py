@@ -0,0 +1,49 @@
+"""差分計算機能の単体テスト"""
+
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from app.infrastructure.database.backup.core import calculate_diff, create_backup
+from app.infrastructure.database.models.session import Session as SessionModel
+
+
+class TestCalculateDiff:
+    """calculate_diff関数のテスト"""
+
+    def test_calculate_diff_exact(
+        self,
+        test_engine: Engine,
+        sample_session_data: list[SessionModel],
+        tmp_path: Path,
+    ) -> None:
+        """バックアップ直後の差分が0になること"""
+        backup_file = create_backup(output_dir=tmp_path / "backups")
+
+        diff_summary = calculate_diff(backup_file)
+
+        assert diff_summary.tables["sessions"].backup_rows == 3
+        assert diff_summary.tables["sessions"].current_rows == 3
+        assert diff_summary.tables["sessions"].diff == 0
+        assert "alembic_version" not in diff_summary.tables
+
+    def test_calculate_diff_estimate(
+        self,
+        test_engine: Engine,
+        sample_session_data: list[SessionModel],
+        tmp_path: Path,
+    ) -> None:
+        """exact=Falseの場合、統計情報による推定行数が使用されること"""
+        backup_file = create_backup(output_dir=tmp_path / "backups")
+
+        # 統計情報を更新（reltuplesを確定させる）
+        with test_engine.connect() as conn:
+            conn.execution_options(isolation_level="AUTOCOMMIT").execute(
+                text("ANALYZE sessions")
+            )
+
+        diff_summary = calculate_diff(backup_file, exact=False)
+
+        assert diff_summary.tables["sessions"].backup_rows == 3
+        assert diff_summary.tables["sessions"].current_rows == 3
@@ -1,7 +1,10 @@
 """リストア機能の単体テスト"""
 
+import gzip
 from pathlib import Path
 
+import zstandard
+from sqlalchemy import text
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 
@@ -122,7 +125,7 @@ class TestRestoreBackup:
 
             new_session = SessionModel(
                 session_id="test_session_new",
-                data="encrypted_data_new",
+                data=b"encrypted_data_new",
                 expires_at=datetime.now(UTC),
                 fingerprint="fingerprint_new",
                 csrf_token="csrf_token_new",
@@ -162,6 +165,79 @@ class TestRestoreBackup:
         finally:
             db.close()
 
+    def test_restore_backup_legacy_gzip(
+        self,
+        test_engine: Engine,
+        sample_session_data: list[SessionModel],
+        tmp_path: Path,
+    ) -> None:
+        """旧形式（gzip）のバックアップからもリストアできること"""
+        output_dir = tmp_path / "backups"
+
+        # zstd形式のバックアップをgzip形式に変換
+        backup_file = create_backup(output_dir=output_dir)
+        with zstandard.open(backup_file, "rb") as f:
+            json_bytes = f.read()
+        legacy_file = output_dir / "backup_20250101_120000.backup.gz"
+        legacy_file.write_bytes(gzip.compress(json_bytes))
+
+        result = restore_backup(legacy_file, show_diff=False)
+
+        # 成功していること
+        assert result.success is True
+        assert result.restored_rows == 3
+
+    def test_restore_backup_after_column_change(
+        self,
+        test_engine: Engine,
+        sample_session_data: list[SessionModel],
+        tmp_path: Path,
+    ) -> None:
+        """同一プロセス内でバックアップ後にカラムが変更されてもリストアできること"""
+        output_dir = tmp_path / "backups"
+
+        with test_engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TABLE backup_schema_test "
+                    "(id INTEGER PRIMARY KEY, payload JSONB)"
+                )
+            )
+            conn.execute(
+                text(
+                    "INSERT INTO backup_schema_test (id, payload) "
+                    """VALUES (1, '{"key": "value"}')"""
+                )
+            )
+        try:
+            backup_file = create_backup(output_dir=output_dir / "before")
+
+            # payloadカラムがない状態のスキーマをキャッシュさせる
+            with test_engine.begin() as conn:
+                conn.execute(text("ALTER TABLE backup_schema_test DROP COLUMN payload"))
+            create_backup(output_dir=output_dir / "without_payload")
+
+            # マイグレーションでカラムが戻された想定
+            with test_engine.begin() as conn:
+                conn.execute(
+                    text("ALTER TABLE backup_schema_test ADD COLUMN payload JSONB")
+                )
+
+            result = restore_backup(backup_file, show_diff=False)
+
+            # 成功していること
+            assert result.success is True, result.message
+
+            # JSONカラムの値が復元されていること
+            with test_engine.connect() as conn:
+                payload = conn.execute(
+                    text("SELECT payload FROM backup_schema_test WHERE id = 1")
+                ).scalar_one()
+            assert payload == {"key": "value"}
+        finally:
+            with test_engine.begin() as conn:
+                conn.execute(text("DROP TABLE IF EXISTS backup_schema_test"))
+
     def test_restore_backup_nonexistent_file(
         self, test_engine: Engine, tmp_path: Path
     ) -> None:
@@ -4,9 +4,14 @@
 
 from datetime import datetime, timedelta
 
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
 
-from app.infrastructure.repositories.session_repository import SessionService
+from app.infrastructure.database.models.session import Session as SessionModel
+from app.infrastructure.repositories.session_repository import (
+    SessionCache,
+    SessionService,
+)
 
 
 class TestSessionService:
@@ -23,7 +28,7 @@ class TestSessionService:
         session_id, csrf_token = service.create_session(data, user_agent, client_ip)
         assert isinstance(session_id, str)
         assert isinstance(csrf_token, str)
-        assert len(session_id) == 64
+        assert len(session_id) == 43
         assert len(csrf_token) == 64
 
         # 取得
@@ -84,7 +89,7 @@ class TestSessionService:
 
         new_session_id, new_csrf_token = result
         assert new_session_id != old_session_id
-        assert len(new_session_id) == 64
+        assert len(new_session_id) == 43
         assert len(new_csrf_token) == 64
 
         # 古いIDでは取得できない
@@ -125,3 +130,56 @@ class TestSessionService:
         # 期限切れセッションは取得できない
         retrieved_data = service.get_session(session_id, user_agent, client_ip)
         assert retrieved_data is None
+
+    def test_get_session_with_precomputed_fingerprint(
+        self, db_session: Session
+    ) -> None:
+        """計算済みのフィンガープリントで検証できること"""
+        from app.infrastructure.security.encryption import generate_fingerprint
+
+        service = SessionService(db_session)
+        user_agent = "Mozilla/5.0"
+        client_ip = "127.0.0.1"
+        fingerprint = generate_fingerprint(user_agent, client_ip)
+
+        session_id, _ = service.create_session(
+            {"user_id": 123}, user_agent, client_ip, fingerprint=fingerprint
+        )
+
+        retrieved_data = service.get_session(session_id, fingerprint=fingerprint)
+        assert retrieved_data is not None
+        assert retrieved_data["user_id"] == 123
+
+    def test_cached_session_skips_database(self, db_session: Session) -> None:
+        """キャッシュ有効時はDBを参照せずにセッションを取得し、削除時に無効化されること"""
+        cache = SessionCache(ttl=60, max_size=100)
+        service = SessionService(db_session, cache=cache)
+        user_agent = "Mozilla/5.0"
+        client_ip = "127.0.0.1"
+
+        session_id, _ = service.create_session({"user_id": 1}, user_agent, client_ip)
+
+        # DBから直接削除しても、キャッシュから取得できること
+        db_session.execute(
+            delete(SessionModel).where(SessionModel.session_id == session_id)
+        )
+        db_session.commit()
+        assert service.get_session(session_id, user_agent, client_ip) == {"user_id": 1}
+
+        # 削除でキャッシュが無効化されること
+        service.delete_session(session_id)
+        assert cache.get(session_id) is None
+        assert service.get_session(session_id, user_agent, client_ip) is None
+
+    def test_cached_session_fingerprint_mismatch(self, db_session: Session) -> None:
+        """キャッシュヒット時もフィンガープリント不一致のセッションは削除されること"""
+        cache = SessionCache(ttl=60, max_size=100)
+        service = SessionService(db_session, cache=cache)
+
+        session_id, _ = service.create_session(
+            {"user_id": 1}, "Mozilla/5.0", "127.0.0.1"
+        )
+
+        assert service.get_session(session_id, "Chrome/90.0", "127.0.0.1") is None
+        assert cache.get(session_id) is None
+        assert service.get_session(session_id, "Mozilla/5.0", "127.0.0.1") is None
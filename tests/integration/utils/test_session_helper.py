@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, Mock
 
 from fastapi import Request, Response
 from sqlalchemy.orm import Session
+from starlette.datastructures import State
 
 
 class TestSessionCookieOperations:
@@ -16,6 +17,7 @@ class TestSessionCookieOperations:
         from app.utils.session_helper import create_session
 
         request = Mock(spec=Request)
+        request.state = State()
         request.headers.get.return_value = "Mozilla/5.0"
         mock_client = Mock()
         mock_client.host = "127.0.0.1"
@@ -28,7 +30,7 @@ class TestSessionCookieOperations:
 
         assert isinstance(session_id, str)
         assert isinstance(csrf_token, str)
-        assert len(session_id) == 64
+        assert len(session_id) == 43
         assert len(csrf_token) == 64
         # Cookieが設定されたことを確認
         response.set_cookie.assert_called_once()
@@ -39,6 +41,7 @@ class TestSessionCookieOperations:
 
         # セッション作成
         request = Mock(spec=Request)
+        request.state = State()
         request.headers.get.return_value = "Mozilla/5.0"
         mock_client = Mock()
         mock_client.host = "127.0.0.1"
@@ -63,6 +66,7 @@ class TestSessionCookieOperations:
         from app.utils.session_helper import get_session_data
 
         request = Mock(spec=Request)
+        request.state = State()
         mock_cookies = MagicMock()
         mock_cookies.get.return_value = None
         request.cookies = mock_cookies
@@ -76,6 +80,7 @@ class TestSessionCookieOperations:
 
         # セッション作成
         request = Mock(spec=Request)
+        request.state = State()
         request.headers.get.return_value = "Mozilla/5.0"
         mock_client = Mock()
         mock_client.host = "127.0.0.1"
@@ -100,6 +105,7 @@ class TestSessionCookieOperations:
         from app.utils.session_helper import update_session_data
 
         request = Mock(spec=Request)
+        request.state = State()
         mock_cookies = MagicMock()
         mock_cookies.get.return_value = None
         request.cookies = mock_cookies
@@ -113,6 +119,7 @@ class TestSessionCookieOperations:
 
         # セッション作成
         request = Mock(spec=Request)
+        request.state = State()
         request.headers.get.return_value = "Mozilla/5.0"
         mock_client = Mock()
         mock_client.host = "127.0.0.1"
@@ -138,6 +145,7 @@ class TestSessionCookieOperations:
         from app.utils.session_helper import delete_session
 
         request = Mock(spec=Request)
+        request.state = State()
         mock_cookies = MagicMock()
         mock_cookies.get.return_value = None
         request.cookies = mock_cookies
@@ -153,6 +161,7 @@ class TestSessionCookieOperations:
 
         # セッション作成
         request = Mock(spec=Request)
+        request.state = State()
         request.headers.get.return_value = "Mozilla/5.0"
         mock_client = Mock()
         mock_client.host = "127.0.0.1"
@@ -182,6 +191,7 @@ class TestSessionCookieOperations:
         from app.utils.session_helper import regenerate_session_id
 
         request = Mock(spec=Request)
+        request.state = State()
         mock_cookies = MagicMock()
         mock_cookies.get.return_value = None
         request.cookies = mock_cookies
@@ -197,6 +207,7 @@ class TestSessionCookieOperations:
 
         # セッション作成
         request = Mock(spec=Request)
+        request.state = State()
         request.headers.get.return_value = "Mozilla/5.0"
         mock_client = Mock()
         mock_client.host = "127.0.0.1"
@@ -220,6 +231,7 @@ class TestSessionCookieOperations:
         from app.utils.session_helper import get_csrf_token
 
         request = Mock(spec=Request)
+        request.state = State()
         mock_cookies = MagicMock()
         mock_cookies.get.return_value = None
         request.cookies = mock_cookies
@@ -59,3 +59,17 @@ class TestConfigIsSupabase:
             SESSION_ENCRYPTION_KEY=Fernet.generate_key().decode(),
         )
         assert settings.is_supabase is True
+
+
+class TestConfigAccessLogEnabled:
+    """access_log_enabledプロパティのテスト"""
+
+    def test_disabled_in_production_by_default(self) -> None:
+        """未設定の場合、本番環境のみFalseを返すこと"""
+        assert Settings(_env_file=None, ENV_MODE="prod").access_log_enabled is False
+        assert Settings(_env_file=None, ENV_MODE="stg").access_log_enabled is True
+
+    def test_explicit_setting(self) -> None:
+        """ACCESS_LOGが設定されている場合、その値を返すこと"""
+        settings = Settings(_env_file=None, ENV_MODE="production", ACCESS_LOG=True)
+        assert settings.access_log_enabled is True
@@ -0,0 +1,86 @@
+"""
+並列バックアップ時のテーブル書き出しの単体テスト（DB不要）
+"""
+
+import io
+import threading
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table
+
+from app.infrastructure.database.backup import core
+from app.infrastructure.database.backup.core import _CountingWriter, _write_tables
+
+
+class _TrackedSpool(io.BytesIO):
+    """未クローズの一時ファイル数を数えるBytesIO"""
+
+    open_count = 0
+    max_open_count = 0
+    lock = threading.Lock()
+
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        with self.lock:
+            type(self).open_count += 1
+            type(self).max_open_count = max(
+                type(self).max_open_count, type(self).open_count
+            )
+
+    def close(self) -> None:
+        if not self.closed:
+            with self.lock:
+                type(self).open_count -= 1
+        super().close()
+
+
+def _make_tables(count: int) -> list[Table]:
+    metadata = MetaData()
+    return [Table(f"t{i}", metadata, Column("id", Integer)) for i in range(count)]
+
+
+@pytest.fixture(autouse=True)
+def reset_spool_counts() -> None:
+    _TrackedSpool.open_count = 0
+    _TrackedSpool.max_open_count = 0
+
+
+class TestWriteTables:
+    """_write_tablesのテスト"""
+
+    def test_limits_pending_spools_to_workers(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """書き出し待ちの一時ファイルがワーカー数を超えて溜まらないこと"""
+
+        def dump(engine: Any, snapshot_id: str, table_obj: Table) -> Any:
+            return _TrackedSpool(b'{"data":[]}'), 1
+
+        monkeypatch.setattr(core, "_dump_table_to_spool", dump)
+        writer = _CountingWriter(io.BytesIO())
+
+        total_rows = _write_tables(writer, Mock(), _make_tables(10), set(), "snap", 2)
+
+        assert total_rows == 10
+        assert _TrackedSpool.max_open_count <= 2
+        assert _TrackedSpool.open_count == 0
+
+    def test_closes_finished_spools_on_error(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """途中のテーブルで失敗した場合も完了済みの一時ファイルを閉じること"""
+
+        def dump(engine: Any, snapshot_id: str, table_obj: Table) -> Any:
+            if table_obj.name == "t0":
+                raise RuntimeError("dump failed")
+            return _TrackedSpool(b'{"data":[]}'), 1
+
+        monkeypatch.setattr(core, "_dump_table_to_spool", dump)
+        writer = _CountingWriter(io.BytesIO())
+
+        with pytest.raises(RuntimeError):
+            _write_tables(writer, Mock(), _make_tables(4), set(), "snap", 4)
+
+        assert _TrackedSpool.open_count == 0
@@ -0,0 +1,73 @@
+"""
+セッションキャッシュの単体テスト（DB不要）
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from app.infrastructure.repositories.session_repository import (
+    CachedSession,
+    SessionCache,
+)
+
+
+def _cached_session(csrf_token: str = "csrf") -> CachedSession:
+    return CachedSession(
+        data=b"encrypted",
+        expires_at=datetime.now(UTC),
+        fingerprint="fingerprint",
+        csrf_token=csrf_token,
+    )
+
+
+class TestSessionCache:
+    """SessionCacheのテスト"""
+
+    def test_get_after_set(self) -> None:
+        """保存したセッションを取得できること"""
+        cache = SessionCache(ttl=60, max_size=10)
+        session = _cached_session()
+
+        cache.set("sid", session)
+
+        assert cache.get("sid") == session
+        assert cache.get("other") is None
+
+    def test_ttl_expiry(self) -> None:
+        """有効期間を過ぎたエントリは取得できないこと"""
+        cache = SessionCache(ttl=60, max_size=10)
+        with patch("time.monotonic", return_value=1000.0):
+            cache.set("sid", _cached_session())
+        with patch("time.monotonic", return_value=1059.0):
+            assert cache.get("sid") is not None
+        with patch("time.monotonic", return_value=1061.0):
+            assert cache.get("sid") is None
+
+    def test_lru_eviction(self) -> None:
+        """最大件数を超えた場合は最も古く参照されたエントリが破棄されること"""
+        cache = SessionCache(ttl=60, max_size=2)
+        cache.set("a", _cached_session("a"))
+        cache.set("b", _cached_session("b"))
+        cache.get("a")  # aを最近参照したものにする
+        cache.set("c", _cached_session("c"))
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_invalidate(self) -> None:
+        """invalidateでエントリが削除されること"""
+        cache = SessionCache(ttl=60, max_size=10)
+        cache.set("sid", _cached_session())
+
+        cache.invalidate("sid")
+
+        assert cache.get("sid") is None
+
+    def test_disabled_when_ttl_is_zero(self) -> None:
+        """TTLが0の場合はキャッシュしないこと"""
+        cache = SessionCache(ttl=0, max_size=10)
+        cache.set("sid", _cached_session())
+
+        assert cache.enabled is False
+        assert cache.get("sid") is None
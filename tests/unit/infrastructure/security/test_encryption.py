@@ -2,6 +2,8 @@
 セキュリティ機能（暗号化・トークン生成）の単体テスト
 """
 
+import sys
+
 import pytest
 from cryptography.fernet import Fernet
 
@@ -39,8 +41,64 @@ class TestSessionEncryption:
         encryptor = SessionEncryption(encryption_key=key)
 
         with pytest.raises((ValueError, Exception)):
-            encryptor.decrypt("invalid-encrypted-data")
+            encryptor.decrypt(b"invalid-encrypted-data")
+
+    def test_fernet_data_can_be_decrypted_with_aesgcm(self) -> None:
+        """Fernet形式で暗号化したデータをAES-GCM設定でも復号化できること"""
+        key = Fernet.generate_key().decode()
+        fernet_encryptor = SessionEncryption(encryption_key=key, backend="auto")
+        aesgcm_encryptor = SessionEncryption(encryption_key=key, backend="aesgcm")
+
+        data = {"user_id": 123}
+        aesgcm_encrypted = aesgcm_encryptor.encrypt(data)
+
+        assert aesgcm_encryptor.decrypt(fernet_encryptor.encrypt(data)) == data
+        assert fernet_encryptor.decrypt(aesgcm_encrypted) == data
+        # Base64を経由しない生のバイト列として保存される
+        assert not aesgcm_encrypted.isascii()
+
+    def test_backends_are_interchangeable(self) -> None:
+        """rfernetとcryptographyで暗号化したデータを相互に復号化できること"""
+        pytest.importorskip("rfernet")
+        key = Fernet.generate_key().decode()
+        rfernet_encryptor = SessionEncryption(encryption_key=key, backend="rfernet")
+        cryptography_encryptor = SessionEncryption(
+            encryption_key=key, backend="cryptography"
+        )
+
+        data = {"user_id": 123, "username": "テストユーザー"}
+
+        assert cryptography_encryptor.decrypt(rfernet_encryptor.encrypt(data)) == data
+        assert rfernet_encryptor.decrypt(cryptography_encryptor.encrypt(data)) == data
+
+    @pytest.mark.parametrize("backend", ["aesgcm", "rfernet", "cryptography"])
+    def test_tampered_token_raises_value_error(self, backend: str) -> None:
+        """改ざんされたトークンの復号化はValueErrorになること"""
+        if backend == "rfernet":
+            pytest.importorskip("rfernet")
+        key = Fernet.generate_key().decode()
+        encryptor = SessionEncryption(encryption_key=key, backend=backend)
+        encrypted = encryptor.encrypt({"user_id": 123})
+
+        with pytest.raises(ValueError):
+            encryptor.decrypt(encrypted[:-1] + bytes([encrypted[-1] ^ 1]))
+
+
+    def test_missing_rfernet_backend_raises(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """rfernetが利用できない状態でbackend="rfernet"を指定した場合は送出すること"""
+        # Noneを登録したモジュールのimportはImportErrorになる
+        monkeypatch.setitem(sys.modules, "rfernet", None)
+        key = Fernet.generate_key().decode()
+
+        with pytest.raises(ImportError):
+            SessionEncryption(encryption_key=key, backend="rfernet")
 
+    def test_invalid_key_raises(self) -> None:
+        """不正な暗号化キーの場合は暗号化なしにフォールバックせず送出すること"""
+        with pytest.raises(ValueError):
+            SessionEncryption(encryption_key="invalid-key", backend="aesgcm")
 
 class TestFingerprint:
     """セッションフィンガープリントのテスト"""
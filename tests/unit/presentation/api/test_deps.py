@@ -60,6 +60,15 @@ class TestAPIKeyAuthentication:
             assert exc_info.value.status_code == 403
             assert "Invalid API key" in exc_info.value.detail
 
+    def test_non_ascii_api_key(self) -> None:
+        """非ASCII文字を含むAPIキーでも403を返すこと"""
+        with patch("app.presentation.api.deps.get_settings") as mock_settings:
+            mock_settings.return_value.API_KEY = "test-api-key"
+
+            with pytest.raises(HTTPException) as exc_info:
+                get_api_key(api_key_header="Bearer tëst-api-key")
+            assert exc_info.value.status_code == 403
+
     def test_case_insensitive_bearer_scheme(self) -> None:
         """Bearerスキームは大文字小文字を区別しない"""
         with patch("app.presentation.api.deps.get_settings") as mock_settings:
@@ -68,6 +77,17 @@ class TestAPIKeyAuthentication:
             result = get_api_key(api_key_header="bearer test-api-key")
             assert result == "test-api-key"
 
+    def test_bearer_scheme_without_api_key(self) -> None:
+        """スキームのみでAPIキーがない場合は403エラー"""
+        with patch("app.presentation.api.deps.get_settings") as mock_settings:
+            mock_settings.return_value.API_KEY = "test-api-key"
+
+            with pytest.raises(HTTPException) as exc_info:
+                get_api_key(api_key_header="BEARER")
+
+            assert exc_info.value.status_code == 403
+            assert "Invalid API key" in exc_info.value.detail
+
 
 class TestSessionDependency:
     """セッション取得のテスト"""
@@ -85,3 +105,20 @@ class TestSessionDependency:
         result = get_session(mock_request)
         assert result == expected_session
         assert result.data["user_id"] == "123"
+
+    def test_get_session_from_dict(self) -> None:
+        """リクエストstateのdictからセッションを構築"""
+        mock_request: Any = Mock()
+        session_data = {"user_id": "123"}
+        mock_request.state.session = session_data
+
+        result = get_session(mock_request)
+        assert result.data is session_data
+
+    def test_get_session_without_session(self) -> None:
+        """セッションがない場合は空のセッションを返す"""
+        mock_request: Any = Mock()
+        mock_request.state.session = None
+
+        result = get_session(mock_request)
+        assert result.data == {}
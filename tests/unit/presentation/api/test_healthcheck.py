@@ -0,0 +1,63 @@
+"""
+ヘルスチェックのDB接続チェックの単体テスト（DB不要）
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.presentation.api.system import healthcheck
+from app.presentation.schemas.system import DatabaseStatus
+
+
+@pytest.fixture(autouse=True)
+def reset_probe_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(healthcheck, "_db_probe_cache", None)
+
+
+def _make_app() -> Any:
+    return SimpleNamespace(state=SimpleNamespace())
+
+
+class TestGetDatabaseStatus:
+    """_get_database_statusのテスト"""
+
+    def test_probe_timeout_returns_unhealthy(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """DB接続チェックが応答しない場合はタイムアウトしてunhealthyを返すこと"""
+
+        def hang() -> None:
+            time.sleep(1)
+
+        monkeypatch.setattr(healthcheck, "_probe_database", hang)
+        monkeypatch.setattr(healthcheck, "_DB_PROBE_TIMEOUT", 0.05)
+
+        started = time.monotonic()
+        db_status, _ = asyncio.run(healthcheck._get_database_status(_make_app()))
+
+        assert time.monotonic() - started < 1
+        assert db_status.status == "unhealthy"
+        assert db_status.error == "Database health check timed out"
+
+    def test_lock_is_created_per_app(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """別のイベントループで動くアプリでもロックを待ち合わせられること"""
+
+        def probe() -> DatabaseStatus:
+            time.sleep(0.01)
+            return DatabaseStatus(status="healthy", connection=True, error=None)
+
+        monkeypatch.setattr(healthcheck, "_probe_database", probe)
+
+        async def contend(app: Any) -> None:
+            await asyncio.gather(
+                healthcheck._get_database_status(app),
+                healthcheck._get_database_status(app),
+            )
+
+        for _ in range(2):
+            monkeypatch.setattr(healthcheck, "_db_probe_cache", None)
+            asyncio.run(contend(_make_app()))
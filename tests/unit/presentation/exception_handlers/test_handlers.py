@@ -4,8 +4,12 @@ Presentation層例外ハンドラーの単体テスト
 
 import asyncio
 import json
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
 from unittest.mock import MagicMock
 
+import pytest
 from fastapi.exceptions import RequestValidationError
 
 from app.domain.exceptions.base import (
@@ -19,6 +23,7 @@ from app.presentation.exception_handlers.handlers import (
     domain_error_handler,
     validation_exception_handler,
 )
+from app.presentation.exceptions import ErrorResponse
 
 
 class TestDomainErrorHandler:
@@ -95,6 +100,32 @@ class TestDomainErrorHandler:
         assert content["message"] == "Validation error"
         assert content["details"] == details
 
+    @pytest.mark.parametrize(
+        "details",
+        [
+            {
+                "at": datetime(2026, 1, 1, tzinfo=UTC),
+                "amount": Decimal("1.5"),
+                "ids": {1},
+            },
+            # orjsonで扱えない値（64bitを超える整数）
+            {"big": 2**70},
+        ],
+    )
+    def test_details_serialized_like_error_response(
+        self, details: dict[str, Any]
+    ) -> None:
+        """detailsの値がErrorResponseモデルと同じ形式でシリアライズされること"""
+        error = NotFoundError("User not found", details=details)
+        request = MagicMock()
+
+        response = asyncio.run(domain_error_handler(request, error))
+
+        expected = ErrorResponse(
+            code="not_found", message="User not found", details=details
+        )
+        assert bytes(response.body) == expected.model_dump_json().encode()
+
 
 class TestValidationExceptionHandler:
     """validation_exception_handler関数のテスト"""
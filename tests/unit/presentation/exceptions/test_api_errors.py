@@ -0,0 +1,52 @@
+"""
+Presentation層APIエラーの単体テスト
+"""
+
+import pytest
+
+from app.domain.exceptions.base import (
+    BadRequestError,
+    DomainError,
+    ForbiddenError,
+    NotFoundError,
+    UnauthorizedError,
+    ValidationError,
+)
+from app.presentation.exceptions import APIError, domain_error_to_api_error
+
+
+class TestDomainErrorToAPIError:
+    """domain_error_to_api_error関数のテスト"""
+
+    @pytest.mark.parametrize(
+        ("domain_error", "status_code"),
+        [
+            (NotFoundError("User not found"), 404),
+            (BadRequestError("Invalid input"), 400),
+            (UnauthorizedError("Token expired"), 401),
+            (ForbiddenError("Insufficient permissions"), 403),
+            (ValidationError(details=[{"field": "email"}]), 400),
+            (DomainError("Unexpected", code="unexpected"), 500),
+        ],
+    )
+    def test_status_code(self, domain_error: DomainError, status_code: int) -> None:
+        """エラーの種類に応じたステータスコードが設定されること"""
+        api_error = domain_error_to_api_error(domain_error)
+
+        assert api_error.status_code == status_code
+        assert api_error.error_code == domain_error.code
+        assert api_error.error_message == domain_error.message
+        assert api_error.details == domain_error.details
+
+    def test_same_attributes_as_constructor(self) -> None:
+        """APIErrorのコンストラクタで生成した場合と同じ属性を持つこと"""
+        domain_error = NotFoundError("User not found", details={"user_id": 123})
+
+        api_error = domain_error_to_api_error(domain_error)
+        expected = APIError(message="User not found", details={"user_id": 123})
+        expected.status_code = 404
+        expected.error_code = "not_found"
+
+        assert vars(api_error) == vars(expected)
+        assert api_error.args == expected.args
+        assert str(api_error) == str(expected)
@@ -0,0 +1,132 @@
+"""
+セッションミドルウェアの単体テスト（DB不要）
+"""
+
+import asyncio
+from typing import Any
+
+import pytest
+from fastapi import Request
+from starlette.types import Receive, Scope, Send
+
+from app.presentation.middleware import session as session_middleware
+from app.presentation.middleware.session import (
+    SessionMiddleware,
+    _get_client_info,
+    _get_session_id,
+)
+
+
+def _make_request(
+    headers: list[tuple[bytes, bytes]], client: tuple[str, int] | None = None
+) -> Request:
+    return Request({"type": "http", "headers": headers, "client": client})
+
+
+class TestGetClientInfo:
+    """User-Agent・クライアントIP取得のテスト"""
+
+    def test_cf_connecting_ip_takes_precedence(self) -> None:
+        """CF-Connecting-IPがX-Forwarded-Forより優先されること"""
+        request = _make_request([
+            (b"x-forwarded-for", b"198.51.100.1"),
+            (b"cf-connecting-ip", b"203.0.113.1"),
+            (b"user-agent", b"Mozilla/5.0"),
+        ])
+
+        assert _get_client_info(request.scope) == ("Mozilla/5.0", "203.0.113.1")
+
+    def test_first_forwarded_for_ip(self) -> None:
+        """X-Forwarded-Forの先頭のIPを使用すること"""
+        request = _make_request([
+            (b"x-forwarded-for", b"203.0.113.1, 198.51.100.1"),
+        ])
+
+        assert _get_client_info(request.scope) == (None, "203.0.113.1")
+
+    def test_fallback_to_client_host(self) -> None:
+        """ヘッダーがない場合はclient.hostを使用すること"""
+        request = _make_request([], client=("192.168.1.1", 12345))
+
+        assert _get_client_info(request.scope) == (None, "192.168.1.1")
+
+
+class TestGetSessionId:
+    """CookieヘッダーからのセッションID取得のテスト"""
+
+    def test_matches_request_cookies(self) -> None:
+        """request.cookiesと同じセッションIDを取得すること"""
+        request = _make_request([
+            (b"cookie", b"theme=dark; session_id=abc123;lang=ja; session_id_old=x"),
+        ])
+
+        assert _get_session_id(request.scope) == "abc123"
+        assert _get_session_id(request.scope) == request.cookies.get("session_id")
+
+    def test_duplicate_cookie_uses_last(self) -> None:
+        """同名のCookieが複数ある場合は最後のものを使用すること"""
+        request = _make_request([(b"cookie", b"session_id=first; session_id=second")])
+
+        assert _get_session_id(request.scope) == request.cookies.get("session_id")
+
+    def test_missing_cookie(self) -> None:
+        """セッションCookieがない場合はNoneを返すこと"""
+        assert _get_session_id(_make_request([]).scope) is None
+        assert (
+            _get_session_id(_make_request([(b"cookie", b"theme=dark")]).scope) is None
+        )
+        assert (
+            _get_session_id(_make_request([(b"cookie", b"session_id=")]).scope) is None
+        )
+
+
+class TestSessionMiddleware:
+    """SessionMiddlewareのテスト"""
+
+    @staticmethod
+    def _run(path: str, monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+        def load_session(*args: Any) -> dict[str, Any]:
+            return {"loaded": True}
+
+        monkeypatch.setattr(session_middleware, "_HAS_DATABASE", True)
+        monkeypatch.setattr(session_middleware, "SessionLocal", object())
+        monkeypatch.setattr(session_middleware, "_load_session", load_session)
+
+        captured: dict[str, Any] = {}
+
+        async def app(scope: Scope, receive: Receive, send: Send) -> None:
+            captured.update(scope["state"])
+
+        scope = {
+            "type": "http",
+            "path": path,
+            "headers": [(b"cookie", b"session_id=abc123")],
+        }
+        middleware = SessionMiddleware(app, skip_paths=["/docs", "/openapi.json"])
+        asyncio.run(middleware(scope, None, None))  # type: ignore[arg-type]
+        return captured
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/api/system/healthcheck",
+            "/api/system/healthcheck/",
+            "/static/app.js",
+            "/docs",
+            "/openapi.json",
+        ],
+    )
+    def test_skip_paths_do_not_load_session(
+        self, path: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """セッションを使用しないパスではセッションを読み込まないこと"""
+        assert self._run(path, monkeypatch) == {"session": None}
+
+    @pytest.mark.parametrize(
+        "path", ["/docs-export", "/documents", "/redocs", "/staticfiles", "/api/users"]
+    )
+    def test_similar_paths_load_session(
+        self, path: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """スキップ対象と前方一致するだけのパスではセッションを読み込むこと"""
+        assert self._run(path, monkeypatch)["session"] == {"loaded": True}
@@ -0,0 +1,106 @@
+"""
+SPA対応の静的ファイルサーバーの単体テスト
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.responses import FileResponse
+
+from app.presentation.static.spa import SPAStaticFiles
+
+
+def _make_scope(path: str) -> dict[str, Any]:
+    return {"type": "http", "method": "GET", "path": path, "headers": []}
+
+
+class TestSPAStaticFiles:
+    """SPAStaticFilesのテスト"""
+
+    def test_unknown_path_returns_index(self, tmp_path: Path) -> None:
+        """存在しないパスではindex.htmlを返すこと"""
+        (tmp_path / "index.html").write_text("<html>spa</html>")
+        static_files = SPAStaticFiles(directory=str(tmp_path), html=True)
+
+        response = asyncio.run(
+            static_files.get_response("users/1", _make_scope("/admin/users/1"))
+        )
+
+        assert response.status_code == 200
+        assert response.body == b"<html>spa</html>"
+
+    def test_missing_path_serves_404_html(self, tmp_path: Path) -> None:
+        """404.htmlがある場合はStaticFilesと同様にそれを404で返すこと"""
+        (tmp_path / "index.html").write_text("<html>spa</html>")
+        (tmp_path / "404.html").write_text("<html>not found</html>")
+        static_files = SPAStaticFiles(directory=str(tmp_path), html=True)
+
+        response = asyncio.run(
+            static_files.get_response("users/1", _make_scope("/admin/users/1"))
+        )
+
+        assert response.status_code == 404
+        assert isinstance(response, FileResponse)
+        assert Path(response.path).name == "404.html"
+
+    def test_index_is_cached(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """index.htmlが変更されていない間は読み直さないこと"""
+        (tmp_path / "index.html").write_text("<html>spa</html>")
+        static_files = SPAStaticFiles(directory=str(tmp_path), html=True)
+
+        asyncio.run(static_files.get_response("a", _make_scope("/admin/a")))
+
+        def fail_read_bytes(self: Path) -> bytes:
+            raise AssertionError("index.html must not be read again")
+
+        monkeypatch.setattr(Path, "read_bytes", fail_read_bytes)
+        response = asyncio.run(static_files.get_response("b", _make_scope("/admin/b")))
+
+        assert response.body == b"<html>spa</html>"
+
+    def test_index_is_reloaded_when_changed(self, tmp_path: Path) -> None:
+        """index.htmlが置き換えられた場合は読み直すこと"""
+        index_path = tmp_path / "index.html"
+        index_path.write_text("<html>spa</html>")
+        static_files = SPAStaticFiles(directory=str(tmp_path), html=True)
+
+        asyncio.run(static_files.get_response("a", _make_scope("/admin/a")))
+        index_path.write_text("<html>redeployed</html>")
+        response = asyncio.run(static_files.get_response("b", _make_scope("/admin/b")))
+
+        assert response.body == b"<html>redeployed</html>"
+
+    def test_index_supports_conditional_request(self, tmp_path: Path) -> None:
+        """index.htmlにETagを付与し、一致する場合は304を返すこと"""
+        (tmp_path / "index.html").write_text("<html>spa</html>")
+        static_files = SPAStaticFiles(directory=str(tmp_path), html=True)
+
+        response = asyncio.run(
+            static_files.get_response("a", _make_scope("/admin/a"))
+        )
+        etag = response.headers["etag"]
+        assert "last-modified" in response.headers
+        assert response.headers["content-type"].startswith("text/html")
+
+        scope = _make_scope("/admin/b")
+        scope["headers"] = [(b"if-none-match", etag.encode())]
+        response = asyncio.run(static_files.get_response("b", scope))
+
+        assert response.status_code == 304
+
+    def test_existing_file_is_served(self, tmp_path: Path) -> None:
+        """存在するファイルはそのまま返すこと"""
+        (tmp_path / "index.html").write_text("<html>spa</html>")
+        (tmp_path / "app.js").write_text("console.log('spa')")
+        static_files = SPAStaticFiles(directory=str(tmp_path), html=True)
+
+        response = asyncio.run(
+            static_files.get_response("app.js", _make_scope("/admin/app.js"))
+        )
+
+        assert response.status_code == 200
+        assert getattr(response, "path", None) == str((tmp_path / "app.js").resolve())